@@ -0,0 +1,791 @@
+# Generated by Django 4.2.7 on 2026-10-16 10:12
+"""
+Brings the committed migration state up to the accounts models that earlier
+deployments created from untracked, locally generated migrations. It exists
+so visitors.0002_sync_schema_with_models can point Visitor.linked_booking
+at accounts.RoomBooking.
+
+Fresh databases apply this normally. On a database that already has these
+tables, fake it. Faking visitors.0002_sync_schema_with_models fakes this
+migration too:
+
+    python manage.py migrate accounts 0002_sync_schema_with_models --fake
+"""
+
+import accounts.models
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Agency',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=120, unique=True)),
+                ('code', models.CharField(help_text='Short code e.g. UNDP, UNICEF', max_length=20, unique=True)),
+                ('logo', models.ImageField(blank=True, help_text='Agency logo (used on QR codes and reports)', null=True, upload_to='agency_logos/')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='Asset',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=150)),
+                ('serial_number', models.CharField(blank=True, max_length=120, null=True)),
+                ('asset_tag', models.CharField(blank=True, max_length=80, null=True)),
+                ('status', models.CharField(choices=[('available', 'Available'), ('assigned', 'Assigned'), ('maintenance', 'Maintenance'), ('retired', 'Retired')], default='available', max_length=20)),
+                ('acquired_at', models.DateField(blank=True, help_text='Purchase/receipt date (used for EOL)', null=True)),
+                ('retired_at', models.DateField(blank=True, null=True)),
+                ('tag_generated', models.BooleanField(default=False)),
+                ('qr_code', models.ImageField(blank=True, null=True, upload_to='asset_qr/')),
+                ('qr_payload', models.TextField(blank=True, default='')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('agency', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='assets', to='accounts.agency')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='AssetCategory',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=80)),
+                ('service_life_months', models.PositiveIntegerField(default=36, help_text='Expected lifespan in months. When reached, asset should be replaced.')),
+                ('eol_enabled', models.BooleanField(default=True, help_text='If enabled, assets under this category will be flagged as end-of-life when due.')),
+                ('agency', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='asset_categories', to='accounts.agency')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='ConsumableCategory',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100)),
+                ('category_type', models.CharField(choices=[('office_supply', 'Office Supply'), ('toiletry', 'Toiletry / Hygiene'), ('accessory', 'Accessory / Peripheral'), ('stationery', 'Stationery'), ('other', 'Other')], default='other', max_length=20)),
+                ('description', models.TextField(blank=True)),
+                ('is_active', models.BooleanField(default=True)),
+                ('agency', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='consumable_categories', to='accounts.agency')),
+            ],
+            options={
+                'verbose_name_plural': 'Consumable categories',
+                'ordering': ['category_type', 'name'],
+            },
+        ),
+        migrations.CreateModel(
+            name='ConsumableItem',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=150)),
+                ('description', models.TextField(blank=True)),
+                ('unit_of_measure', models.CharField(default='piece', help_text='e.g. piece, box, roll, pack, litre', max_length=40)),
+                ('stock_qty', models.PositiveIntegerField(default=0)),
+                ('low_stock_threshold', models.PositiveIntegerField(default=5, help_text='Alert when stock falls at or below this number')),
+                ('max_per_request', models.PositiveIntegerField(blank=True, help_text='Max qty a user can request at once (blank = no limit)', null=True)),
+                ('is_active', models.BooleanField(default=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('agency', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='consumable_items', to='accounts.agency')),
+                ('category', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='items', to='accounts.consumablecategory')),
+            ],
+            options={
+                'ordering': ['category__name', 'name'],
+            },
+        ),
+        migrations.CreateModel(
+            name='ConsumableRequest',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('notes', models.TextField(blank=True, help_text='Justification or delivery notes')),
+                ('status', models.CharField(choices=[('pending', 'Pending Approval'), ('approved', 'Approved — Awaiting Dispatch'), ('partially_fulfilled', 'Partially Fulfilled'), ('fulfilled', 'Fulfilled'), ('rejected', 'Rejected'), ('cancelled', 'Cancelled')], default='pending', max_length=25)),
+                ('approved_at', models.DateTimeField(blank=True, null=True)),
+                ('reject_reason', models.TextField(blank=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('agency', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='consumable_requests', to='accounts.agency')),
+            ],
+            options={
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='MobileLine',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('line_type', models.CharField(choices=[('sim', 'SIM Card'), ('data', 'Data Plan'), ('sim_data', 'SIM + Data')], max_length=20)),
+                ('provider', models.CharField(blank=True, max_length=80)),
+                ('msisdn', models.CharField(max_length=30, unique=True)),
+                ('sim_serial', models.CharField(blank=True, max_length=80)),
+                ('status', models.CharField(choices=[('available', 'Available'), ('assigned', 'Assigned'), ('suspended', 'Suspended (Disable)'), ('retired', 'Retired')], default='available', max_length=20)),
+                ('issued_at', models.DateTimeField(blank=True, null=True)),
+                ('suspended_at', models.DateTimeField(blank=True, null=True)),
+                ('notes', models.TextField(blank=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('agency', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='accounts.agency')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='RegistrationInvite',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('code', models.CharField(default=accounts.models.generate_invite_code, max_length=64, unique=True)),
+                ('max_uses', models.PositiveIntegerField(default=100)),
+                ('used_count', models.PositiveIntegerField(default=0)),
+                ('valid_for_hours', models.PositiveIntegerField(default=12)),
+                ('is_active', models.BooleanField(default=True)),
+                ('expires_at', models.DateTimeField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='Room',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('approval_mode', models.CharField(choices=[('manual', 'Manual approval (always)'), ('auto', 'Auto approval (always)'), ('mixed', 'Mixed (auto if no approver configured, otherwise manual)')], default='manual', help_text='Controls whether bookings require approval for this room.', max_length=10)),
+                ('auto_approve_notify_approvers', models.BooleanField(default=False, help_text='If auto-approved, still email approvers for visibility (optional).')),
+                ('resource_email', models.EmailField(blank=True, max_length=254, null=True)),
+                ('calendar_sync_enabled', models.BooleanField(default=False)),
+                ('name', models.CharField(max_length=150, unique=True)),
+                ('code', models.CharField(help_text='Short code, e.g. CR-1, LIB-1', max_length=50, unique=True)),
+                ('room_type', models.CharField(choices=[('meeting', 'Meeting Room'), ('conference', 'Conference Room'), ('library', 'Library'), ('other', 'Other')], default='meeting', max_length=20)),
+                ('location', models.CharField(blank=True, help_text='e.g. UN House 1st floor', max_length=255)),
+                ('capacity', models.PositiveIntegerField(blank=True, null=True)),
+                ('description', models.TextField(blank=True)),
+                ('is_active', models.BooleanField(default=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='RoomAmenity',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('code', models.CharField(help_text="Machine-readable code, e.g. 'projector', 'video_conf'", max_length=50, unique=True)),
+                ('name', models.CharField(help_text="Human name, e.g. 'Projector', 'Video Conferencing'", max_length=120)),
+                ('icon_class', models.CharField(blank=True, help_text="Bootstrap icon class, e.g. 'bi-projector', 'bi-camera-video'", max_length=80)),
+                ('description', models.CharField(blank=True, help_text='Optional short description shown as tooltip', max_length=255)),
+                ('is_active', models.BooleanField(default=True, help_text='Hide amenity from selection without deleting it')),
+            ],
+            options={
+                'verbose_name': 'Room amenity',
+                'verbose_name_plural': 'Room amenities',
+                'ordering': ['name'],
+            },
+        ),
+        migrations.AddField(
+            model_name='user',
+            name='employee_id_expiry',
+            field=models.DateField(blank=True, help_text='Date the physical ID card expires', null=True),
+        ),
+        migrations.AddField(
+            model_name='user',
+            name='must_change_password',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddField(
+            model_name='user',
+            name='otp_code',
+            field=models.CharField(blank=True, help_text='Last login OTP sent to the user', max_length=10, null=True),
+        ),
+        migrations.AddField(
+            model_name='user',
+            name='otp_expires_at',
+            field=models.DateTimeField(blank=True, help_text='Expiry time for the last OTP', null=True),
+        ),
+        migrations.AddField(
+            model_name='user',
+            name='temp_password_set_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='user',
+            name='employee_id',
+            field=models.CharField(blank=True, help_text='Staff ID number / badge ID', max_length=20, null=True, unique=True),
+        ),
+        migrations.AlterField(
+            model_name='user',
+            name='role',
+            field=models.CharField(choices=[('requester', 'Requester (Staff)'), ('data_entry', 'Data Entry (Security Guard)'), ('lsa', 'Local Security Associate'), ('soc', 'Security Operations Center'), ('reception', 'Receptionist'), ('registry', 'Registry'), ('ict_focal', 'ICT Focal Point'), ('csm', 'Common Services Manager'), ('agency_hr', 'Agency HR')], default='requester', max_length=20),
+        ),
+        migrations.CreateModel(
+            name='Unit',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=120)),
+                ('is_core_unit', models.BooleanField(default=False, help_text='If true, assets/requests go to Operations Manager approval (agency-level).')),
+                ('agency', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='units', to='accounts.agency')),
+                ('asset_managers', models.ManyToManyField(blank=True, help_text='Additional asset managers for this unit (optional)', related_name='managed_units', to=settings.AUTH_USER_MODEL)),
+                ('unit_head', models.ForeignKey(blank=True, help_text='Unit Head (default asset manager/approver for this unit)', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='headed_units', to=settings.AUTH_USER_MODEL)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='RoomBookingSeries',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('title', models.CharField(max_length=200)),
+                ('description', models.TextField(blank=True)),
+                ('start_date', models.DateField()),
+                ('end_date', models.DateField(blank=True, null=True)),
+                ('start_time', models.TimeField()),
+                ('end_time', models.TimeField()),
+                ('frequency', models.CharField(blank=True, choices=[('daily', 'Daily'), ('weekly', 'Weekly'), ('monthly', 'Monthly'), ('yearly', 'Yearly')], max_length=10, null=True)),
+                ('interval', models.PositiveIntegerField(default=1)),
+                ('weekdays_csv', models.CharField(blank=True, default='', max_length=50)),
+                ('monthly_type', models.CharField(blank=True, choices=[('day', 'On a specific day of the month'), ('weekday', 'On a specific weekday of the month')], default='day', max_length=10)),
+                ('monthly_week', models.IntegerField(blank=True, null=True)),
+                ('monthly_weekday', models.IntegerField(blank=True, null=True)),
+                ('status', models.CharField(choices=[('pending', 'Pending approval'), ('approved', 'Approved'), ('rejected', 'Rejected'), ('cancelled', 'Cancelled')], default='pending', max_length=20)),
+                ('approved_at', models.DateTimeField(blank=True, null=True)),
+                ('rejection_reason', models.TextField(blank=True)),
+                ('ict_support', models.CharField(choices=[('none', 'No ICT support needed'), ('setup', 'Before meeting — Setup / AV configuration'), ('during', 'During meeting — Live technical support')], default='none', max_length=10)),
+                ('attendee_emails', models.TextField(blank=True, help_text='Comma-separated list of guest emails to invite.')),
+                ('virtual_meeting_link', models.URLField(blank=True, help_text='Optional link for virtual attendance (e.g., Teams, Zoom).')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('approved_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='approved_room_series', to=settings.AUTH_USER_MODEL)),
+                ('requested_by', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='room_booking_series', to=settings.AUTH_USER_MODEL)),
+                ('room', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='booking_series', to='accounts.room')),
+            ],
+            options={
+                'verbose_name': 'Room booking series',
+                'verbose_name_plural': 'Room booking series',
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='RoomBooking',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('title', models.CharField(help_text='Meeting title / purpose', max_length=200)),
+                ('description', models.TextField(blank=True)),
+                ('date', models.DateField()),
+                ('start_time', models.TimeField()),
+                ('end_time', models.TimeField()),
+                ('status', models.CharField(choices=[('pending', 'Pending approval'), ('approved', 'Approved'), ('rejected', 'Rejected'), ('cancelled', 'Cancelled')], default='pending', max_length=20)),
+                ('agenda_document', models.FileField(blank=True, help_text='Optional agenda for the meeting.', null=True, upload_to='meeting_agendas/')),
+                ('registration_code', models.UUIDField(editable=False, help_text='Unique code for the public registration link.', null=True)),
+                ('approved_at', models.DateTimeField(blank=True, null=True)),
+                ('rejection_reason', models.TextField(blank=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('ict_support', models.CharField(choices=[('none', 'No ICT support needed'), ('setup', 'Before meeting — Setup / AV configuration'), ('during', 'During meeting — Live technical support')], default='none', max_length=10)),
+                ('attendee_emails', models.TextField(blank=True, help_text='Comma-separated list of guest emails to invite.')),
+                ('virtual_meeting_link', models.URLField(blank=True, help_text='Optional link for virtual attendance (e.g., Teams, Zoom).')),
+                ('survey_sent_at', models.DateTimeField(blank=True, null=True)),
+                ('enable_attendance', models.BooleanField(default=False, help_text='Enable digital attendance tracking for this meeting.')),
+                ('enable_invite_link', models.BooleanField(default=False, help_text='Generate a public invitation/registration link for attendees.')),
+                ('auto_accept_registration', models.BooleanField(default=False, help_text='Automatically accept all registrations without manual approval.')),
+                ('approved_amenities', models.ManyToManyField(blank=True, help_text='Amenities confirmed by the approver.', related_name='approved_for_bookings', to='accounts.roomamenity')),
+                ('approved_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='approved_room_bookings', to=settings.AUTH_USER_MODEL)),
+                ('requested_amenities', models.ManyToManyField(blank=True, help_text='Amenities the user requested.', related_name='requested_in_bookings', to='accounts.roomamenity')),
+                ('requested_by', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='room_bookings', to=settings.AUTH_USER_MODEL)),
+                ('room', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='bookings', to='accounts.room')),
+                ('selected_amenities', models.ManyToManyField(blank=True, related_name='bookings', to='accounts.roomamenity')),
+                ('series', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='occurrences', to='accounts.roombookingseries')),
+            ],
+            options={
+                'ordering': ['-date', 'start_time'],
+            },
+        ),
+        migrations.CreateModel(
+            name='RoomApprover',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('is_primary', models.BooleanField(default=False, help_text='Mark as primary approver / room owner.')),
+                ('can_approve_all_agency', models.BooleanField(default=True, help_text='If checked, can approve bookings regardless of requester agency.')),
+                ('is_active', models.BooleanField(default=True, help_text='Inactive approvers will be ignored by the approval workflow.')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('room', models.ForeignKey(help_text='Room that this user can approve bookings for.', on_delete=django.db.models.deletion.CASCADE, related_name='room_approver_links', to='accounts.room')),
+                ('user', models.ForeignKey(help_text='User who can approve bookings for this room.', on_delete=django.db.models.deletion.CASCADE, related_name='room_approver_roles', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Room approver',
+                'verbose_name_plural': 'Room approvers',
+            },
+        ),
+        migrations.AddField(
+            model_name='room',
+            name='amenities',
+            field=models.ManyToManyField(blank=True, help_text='Available features/amenities in this room', related_name='rooms', to='accounts.roomamenity'),
+        ),
+        migrations.AddField(
+            model_name='room',
+            name='approvers',
+            field=models.ManyToManyField(blank=True, help_text='Users who can approve bookings for this room.', related_name='rooms_to_approve', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.CreateModel(
+            name='RegistrationInviteUsage',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('invite', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='registrations', to='accounts.registrationinvite')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='registration_invite_usages', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.AddField(
+            model_name='registrationinvite',
+            name='created_by',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='created_invites', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.CreateModel(
+            name='OneTimeCode',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('device_id', models.CharField(max_length=64)),
+                ('code', models.CharField(max_length=6)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('expires_at', models.DateTimeField()),
+                ('is_used', models.BooleanField(default=False)),
+                ('ip_address', models.GenericIPAddressField(blank=True, null=True)),
+                ('user_agent', models.TextField(blank=True)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='MobileLineReactivationRequest',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('reason', models.TextField(blank=True)),
+                ('status', models.CharField(choices=[('pending_ops', 'Pending Operations Manager Approval'), ('approved', 'Approved'), ('rejected', 'Rejected'), ('cancelled', 'Cancelled')], default='pending_ops', max_length=20)),
+                ('decided_at', models.DateTimeField(blank=True, null=True)),
+                ('manager_note', models.TextField(blank=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('agency', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='line_reactivation_requests', to='accounts.agency')),
+                ('decided_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='line_reactivation_requests_decided', to=settings.AUTH_USER_MODEL)),
+                ('line', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='reactivation_requests', to='accounts.mobileline')),
+                ('requested_by', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='line_reactivation_requests', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.AddField(
+            model_name='mobileline',
+            name='assigned_to',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='assigned_lines', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='mobileline',
+            name='custodian',
+            field=models.ForeignKey(blank=True, help_text='Person who registers & issues SIM/data lines (e.g., telecom custodian).', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='custodian_lines', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.CreateModel(
+            name='MeetingAttendee',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=200)),
+                ('email', models.EmailField(max_length=254)),
+                ('organization', models.CharField(blank=True, max_length=200)),
+                ('gender', models.CharField(blank=True, choices=[('male', 'Male'), ('female', 'Female'), ('other', 'Other / Prefer not to say')], max_length=10)),
+                ('phone', models.CharField(blank=True, max_length=30)),
+                ('registered_at', models.DateTimeField(auto_now_add=True)),
+                ('is_accepted', models.BooleanField(default=True, help_text='Whether this registration has been accepted by the host. False = pending host review (when auto_accept_registration is off).')),
+                ('accepted_at', models.DateTimeField(blank=True, null=True)),
+                ('booking', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='attendees', to='accounts.roombooking')),
+            ],
+            options={
+                'ordering': ['registered_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='ExitRequest',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('reason', models.CharField(choices=[('resigned', 'Resigned'), ('end_of_service', 'End Of Service'), ('reassigned', 'Reassigned')], max_length=20)),
+                ('typed_confirm', models.CharField(blank=True, max_length=20)),
+                ('status', models.CharField(choices=[('submitted', 'Submitted'), ('pending_returns', 'Pending Asset Returns'), ('pending_ict_confirmation', 'Pending ICT Confirmation'), ('cleared', 'Cleared (All Returned)')], default='submitted', max_length=40)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('cleared_at', models.DateTimeField(blank=True, null=True)),
+                ('agency', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='accounts.agency')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='EmployeeIDCardRequest',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('request_type', models.CharField(choices=[('new', 'New ID Card'), ('replacement', 'Replacement'), ('renewal', 'Renewal')], default='new', max_length=20)),
+                ('reason', models.TextField(blank=True)),
+                ('request_form', models.FileField(blank=True, help_text='Signed request form (PDF or Word).', null=True, upload_to='idcard_requests/forms/')),
+                ('status', models.CharField(choices=[('submitted', 'Submitted'), ('photo_pending', 'Pending Photo Capture'), ('printed', 'Printed'), ('issued', 'Issued'), ('rejected', 'Rejected')], default='submitted', max_length=20)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('approved_at', models.DateTimeField(blank=True, null=True)),
+                ('printed_at', models.DateTimeField(blank=True, null=True)),
+                ('issued_at', models.DateTimeField(blank=True, null=True)),
+                ('approver', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='idcard_requests_approved', to=settings.AUTH_USER_MODEL)),
+                ('for_user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='idcard_requests_for', to=settings.AUTH_USER_MODEL)),
+                ('issued_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='idcard_requests_issued', to=settings.AUTH_USER_MODEL)),
+                ('printed_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='idcard_requests_printed', to=settings.AUTH_USER_MODEL)),
+                ('requested_by', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='idcard_requests_made', to=settings.AUTH_USER_MODEL)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='ConsumableStockLog',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('event', models.CharField(choices=[('dispatched', 'Dispatched to requester'), ('restocked', 'Restocked / received'), ('corrected', 'Manual correction'), ('disposed', 'Disposed / written off')], max_length=15)),
+                ('quantity_before', models.IntegerField()),
+                ('quantity_change', models.IntegerField(help_text='Positive = add, Negative = remove')),
+                ('quantity_after', models.IntegerField()),
+                ('note', models.TextField(blank=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('actor', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to=settings.AUTH_USER_MODEL)),
+                ('agency', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='consumable_stock_logs', to='accounts.agency')),
+                ('item', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='stock_logs', to='accounts.consumableitem')),
+                ('reference_request', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='stock_logs', to='accounts.consumablerequest')),
+            ],
+            options={
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='ConsumableRequestItem',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('quantity_requested', models.PositiveIntegerField()),
+                ('quantity_dispatched', models.PositiveIntegerField(default=0)),
+                ('item', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='request_lines', to='accounts.consumableitem')),
+                ('request', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='line_items', to='accounts.consumablerequest')),
+            ],
+        ),
+        migrations.AddField(
+            model_name='consumablerequest',
+            name='approved_by',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='consumable_requests_approved', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='consumablerequest',
+            name='linked_asset',
+            field=models.ForeignKey(blank=True, help_text='Optional: the physical asset this supply is intended for (e.g. the laptop a keyboard is requested for)', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='consumable_requests', to='accounts.asset'),
+        ),
+        migrations.AddField(
+            model_name='consumablerequest',
+            name='requester',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='consumable_requests', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='consumablerequest',
+            name='unit',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='consumable_requests', to='accounts.unit'),
+        ),
+        migrations.CreateModel(
+            name='ConsumableAssetLink',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('note', models.CharField(blank=True, help_text="Optional label, e.g. 'Primary keyboard', 'Black ink only'", max_length=255)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('agency', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='consumable_asset_links', to='accounts.agency')),
+                ('asset', models.ForeignKey(blank=True, help_text='Specific asset (1-to-1 pairing)', null=True, on_delete=django.db.models.deletion.CASCADE, related_name='consumable_links', to='accounts.asset')),
+                ('asset_category', models.ForeignKey(blank=True, help_text='Asset category (class-level pairing; all assets in this category share this consumable)', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='consumable_links', to='accounts.assetcategory')),
+                ('consumable_item', models.ForeignKey(help_text='The peripheral / supply item', on_delete=django.db.models.deletion.CASCADE, related_name='asset_links', to='accounts.consumableitem')),
+                ('created_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='consumable_asset_links_created', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Consumable–Asset link',
+                'verbose_name_plural': 'Consumable–Asset links',
+                'ordering': ['consumable_item__name', 'asset__name'],
+            },
+        ),
+        migrations.CreateModel(
+            name='CellServiceFocalPoint',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=120)),
+                ('company_name', models.CharField(blank=True, max_length=160)),
+                ('email', models.EmailField(max_length=254)),
+                ('is_active', models.BooleanField(default=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('agency', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='cell_service_focal_points', to='accounts.agency')),
+            ],
+            options={
+                'ordering': ['company_name', 'name'],
+            },
+        ),
+        migrations.CreateModel(
+            name='AttendanceRecord',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=200)),
+                ('email', models.EmailField(max_length=254)),
+                ('organization', models.CharField(blank=True, max_length=200)),
+                ('gender', models.CharField(blank=True, choices=[('male', 'Male'), ('female', 'Female'), ('other', 'Other / Prefer not to say')], help_text='Gender (collected during attendance check-in)', max_length=10)),
+                ('phone', models.CharField(blank=True, help_text='Phone number (optional)', max_length=30)),
+                ('status', models.CharField(choices=[('present', 'Present (Auto)'), ('pending_approval', 'Pending Host Approval'), ('approved', 'Approved by Host'), ('rejected', 'Rejected by Host')], default='pending_approval', max_length=20)),
+                ('was_invited', models.BooleanField(default=False)),
+                ('was_preregistered', models.BooleanField(default=False)),
+                ('checked_in_at', models.DateTimeField(auto_now_add=True)),
+                ('decided_at', models.DateTimeField(blank=True, null=True)),
+                ('note', models.TextField(blank=True)),
+                ('booking', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='attendance_records', to='accounts.roombooking')),
+                ('decided_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='attendance_decisions', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Attendance record',
+                'verbose_name_plural': 'Attendance records',
+                'ordering': ['checked_in_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='AssetVerification',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('verified_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('method', models.CharField(choices=[('manual', 'Manual Entry'), ('scan', 'Scan / QR')], default='manual', max_length=10)),
+                ('tag_entered', models.CharField(blank=True, default='', max_length=80)),
+                ('note', models.TextField(blank=True, default='')),
+                ('location', models.CharField(blank=True, default='', max_length=120)),
+                ('agency', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='asset_verifications', to='accounts.agency')),
+                ('asset', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='verifications', to='accounts.asset')),
+                ('verified_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ('-verified_at',),
+            },
+        ),
+        migrations.CreateModel(
+            name='AssetReturnRequest',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(choices=[('pending_ict', 'Pending ICT Verification'), ('received', 'Received by ICT'), ('rejected', 'Rejected'), ('cancelled', 'Cancelled')], default='pending_ict', max_length=20)),
+                ('reason', models.TextField(blank=True)),
+                ('verified_at', models.DateTimeField(blank=True, null=True)),
+                ('verification_note', models.TextField(blank=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('agency', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='asset_returns', to='accounts.agency')),
+                ('asset', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='return_requests', to='accounts.asset')),
+                ('requested_by', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='asset_returns_requested', to=settings.AUTH_USER_MODEL)),
+                ('verified_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='asset_returns_verified', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='AssetRequest',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('justification', models.TextField(blank=True)),
+                ('status', models.CharField(choices=[('draft', 'Draft'), ('pending_manager', 'Pending Manager Approval'), ('rejected', 'Rejected'), ('approved_manager', 'Approved by Manager'), ('pending_ict', 'Pending ICT Assignment'), ('assigned', 'Asset Assigned'), ('received', 'Received & Verified'), ('cancelled', 'Cancelled')], default='pending_manager', max_length=30)),
+                ('manager_decision_at', models.DateTimeField(blank=True, null=True)),
+                ('manager_reject_reason', models.TextField(blank=True)),
+                ('ict_assigned_at', models.DateTimeField(blank=True, null=True)),
+                ('requester_verified_at', models.DateTimeField(blank=True, null=True)),
+                ('tag_generated', models.BooleanField(default=False)),
+                ('qr_code', models.ImageField(blank=True, null=True, upload_to='asset_qr/')),
+                ('qr_payload', models.TextField(blank=True, default='')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('agency', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='asset_requests', to='accounts.agency')),
+                ('assigned_asset', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='requests', to='accounts.asset')),
+                ('category', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='asset_requests', to='accounts.assetcategory')),
+                ('ict_assigned_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='asset_requests_assigned', to=settings.AUTH_USER_MODEL)),
+                ('manager_approved_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='asset_requests_approved', to=settings.AUTH_USER_MODEL)),
+                ('requester', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='asset_requests', to=settings.AUTH_USER_MODEL)),
+                ('unit', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='asset_requests', to='accounts.unit')),
+            ],
+            options={
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='AssetHistory',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('event', models.CharField(choices=[('registered', 'Registered'), ('request_created', 'Request Created'), ('approved', 'Approved'), ('rejected', 'Rejected'), ('assigned', 'Assigned'), ('receipt_verified', 'Receipt Verified'), ('return_initiated', 'Return Initiated'), ('return_received', 'Return Received'), ('maintenance', 'Marked Maintenance'), ('retired', 'Retired/Disposed'), ('status_change', 'Status Change')], max_length=40)),
+                ('note', models.TextField(blank=True)),
+                ('meta', models.JSONField(blank=True, default=dict)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('actor', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to=settings.AUTH_USER_MODEL)),
+                ('agency', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='asset_history', to='accounts.agency')),
+                ('asset', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='history', to='accounts.asset')),
+            ],
+            options={
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='AssetChangeRequest',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('proposed_changes', models.JSONField(blank=True, default=dict)),
+                ('reason', models.TextField(blank=True)),
+                ('status', models.CharField(choices=[('pending_manager', 'Pending Asset Manager Approval'), ('approved', 'Approved'), ('rejected', 'Rejected'), ('cancelled', 'Cancelled')], default='pending_manager', max_length=20)),
+                ('decided_at', models.DateTimeField(blank=True, null=True)),
+                ('manager_note', models.TextField(blank=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('agency', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='asset_change_requests', to='accounts.agency')),
+                ('asset', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='change_requests', to='accounts.asset')),
+                ('decided_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='asset_change_requests_decided', to=settings.AUTH_USER_MODEL)),
+                ('requested_by', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='asset_change_requests', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.AddField(
+            model_name='asset',
+            name='category',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='assets', to='accounts.assetcategory'),
+        ),
+        migrations.AddField(
+            model_name='asset',
+            name='current_holder',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='held_assets', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='asset',
+            name='unit',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='assets', to='accounts.unit'),
+        ),
+        migrations.CreateModel(
+            name='AgencyServiceConfig',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('asset_mgmt_enabled', models.BooleanField(default=False)),
+                ('asset_mgmt_is_paid', models.BooleanField(default=False)),
+                ('asset_mgmt_cost_amount', models.DecimalField(blank=True, decimal_places=2, max_digits=12, null=True)),
+                ('asset_mgmt_cost_currency', models.CharField(blank=True, default='USD', max_length=10)),
+                ('require_manager_approval', models.BooleanField(default=True)),
+                ('require_ict_assignment', models.BooleanField(default=True)),
+                ('require_requester_verification', models.BooleanField(default=True)),
+                ('asset_tag_auto_generate', models.BooleanField(default=True)),
+                ('asset_tag_prefix', models.CharField(default='AST', max_length=20)),
+                ('asset_tag_length', models.PositiveIntegerField(default=6)),
+                ('asset_qr_include_url', models.BooleanField(default=True)),
+                ('agency', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='service_config', to='accounts.agency')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='AgencyAssetRoles',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('agency', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='asset_roles', to='accounts.agency')),
+                ('ict_custodian', models.ManyToManyField(blank=True, help_text='Users allowed to assign assets (ICT custodians).', related_name='ict_custodian_for_agencies', to=settings.AUTH_USER_MODEL)),
+                ('operations_manager', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='ops_manager_for_agencies', to=settings.AUTH_USER_MODEL)),
+            ],
+        ),
+        migrations.AddField(
+            model_name='user',
+            name='agency',
+            field=models.ForeignKey(blank=True, help_text='UN Agency the user belongs to', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='users', to='accounts.agency'),
+        ),
+        migrations.AddField(
+            model_name='user',
+            name='unit',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='users', to='accounts.unit'),
+        ),
+        migrations.CreateModel(
+            name='TrustedDevice',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('device_id', models.CharField(db_index=True, max_length=64)),
+                ('ip_address', models.GenericIPAddressField(blank=True, null=True)),
+                ('user_agent', models.TextField(blank=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('last_used_at', models.DateTimeField(auto_now=True)),
+                ('expires_at', models.DateTimeField()),
+                ('is_active', models.BooleanField(default=True)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'unique_together': {('user', 'device_id')},
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='roomapprover',
+            constraint=models.UniqueConstraint(fields=('room', 'user'), name='unique_room_user_approver'),
+        ),
+        migrations.AddIndex(
+            model_name='onetimecode',
+            index=models.Index(fields=['user', 'device_id', 'code', 'is_used'], name='accounts_on_user_id_761514_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='mobilelinereactivationrequest',
+            index=models.Index(fields=['agency', 'status'], name='accounts_mo_agency__3e1f92_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='mobilelinereactivationrequest',
+            index=models.Index(fields=['agency', 'line'], name='accounts_mo_agency__b330f7_idx'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='meetingattendee',
+            unique_together={('booking', 'email')},
+        ),
+        migrations.AlterUniqueTogether(
+            name='exitrequest',
+            unique_together={('agency', 'user', 'status')},
+        ),
+        migrations.AddIndex(
+            model_name='consumablerequest',
+            index=models.Index(fields=['agency', 'status'], name='accounts_co_agency__c6911a_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='consumablerequest',
+            index=models.Index(fields=['agency', 'requester'], name='accounts_co_agency__9a5126_idx'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='consumablecategory',
+            unique_together={('agency', 'name')},
+        ),
+        migrations.AlterUniqueTogether(
+            name='consumableassetlink',
+            unique_together={('consumable_item', 'asset')},
+        ),
+        migrations.AlterUniqueTogether(
+            name='cellservicefocalpoint',
+            unique_together={('agency', 'email')},
+        ),
+        migrations.AlterUniqueTogether(
+            name='attendancerecord',
+            unique_together={('booking', 'email')},
+        ),
+        migrations.AddIndex(
+            model_name='assetverification',
+            index=models.Index(fields=['agency', 'verified_at'], name='accounts_as_agency__0e0538_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='assetverification',
+            index=models.Index(fields=['agency', 'tag_entered'], name='accounts_as_agency__3c3d0e_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='assetreturnrequest',
+            index=models.Index(fields=['agency', 'status'], name='accounts_as_agency__4f763e_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='assetreturnrequest',
+            index=models.Index(fields=['agency', 'requested_by'], name='accounts_as_agency__3421d9_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='assetrequest',
+            index=models.Index(fields=['agency', 'status'], name='accounts_as_agency__f87554_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='assetrequest',
+            index=models.Index(fields=['agency', 'requester'], name='accounts_as_agency__62bc20_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='assethistory',
+            index=models.Index(fields=['agency', 'asset', 'event'], name='accounts_as_agency__c0e113_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='assethistory',
+            index=models.Index(fields=['agency', 'created_at'], name='accounts_as_agency__4316a5_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='assetchangerequest',
+            index=models.Index(fields=['agency', 'status'], name='accounts_as_agency__73c43a_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='assetchangerequest',
+            index=models.Index(fields=['agency', 'asset'], name='accounts_as_agency__ffef42_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+"""
+Celery application for un_security_system.
+
+Tasks are discovered from each installed app's ``tasks.py``. Run a worker with:
+
+    celery -A un_security_system worker -l info
+"""
+
+import os
+
+from celery import Celery
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'un_security_system.settings')
+
+app = Celery('un_security_system')
+app.config_from_object('django.conf:settings', namespace='CELERY')
+app.autodiscover_tasks()
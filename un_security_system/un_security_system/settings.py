@@ -115,6 +115,12 @@ CHANNEL_LAYERS = {
     },
 }
 
+# Celery (background tasks — broker is the same Redis used by Channels)
+CELERY_BROKER_URL = config('CELERY_BROKER_URL', default='redis://redis:6379/0')
+CELERY_TASK_IGNORE_RESULT = True
+CELERY_TASK_ALWAYS_EAGER = config('CELERY_TASK_ALWAYS_EAGER', default=False, cast=bool)
+CELERY_TIMEZONE = 'Africa/Banjul'
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
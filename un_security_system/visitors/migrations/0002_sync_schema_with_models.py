@@ -0,0 +1,141 @@
+# Generated by Django 4.2.7 on 2026-10-16 10:12
+"""
+Brings the committed migration state up to the visitors models (VisitorCard,
+GroupMember, visitor card/clearance/meeting fields) that earlier deployments
+created from untracked, locally generated migrations.
+
+Fresh databases apply this normally. On a database that already has these
+tables, record it without touching the schema:
+
+    # remove any locally generated accounts/visitors migrations past 0001 first
+    python manage.py migrate visitors 0002_sync_schema_with_models --fake
+    python manage.py migrate
+
+``--fake`` on this migration also fakes its dependency,
+accounts.0002_sync_schema_with_models. The plain ``migrate`` afterwards
+builds only the index migrations that follow.
+"""
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0002_sync_schema_with_models'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('visitors', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='visitor',
+            name='card_issued_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='visitor',
+            name='card_returned_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='visitor',
+            name='clearance_valid_from',
+            field=models.DateField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='visitor',
+            name='clearance_valid_until',
+            field=models.DateField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='visitor',
+            name='linked_booking',
+            field=models.ForeignKey(blank=True, help_text='If set, this access request is tied to a specific meeting. All fields are auto-populated from the meeting and members are synced from accepted registrants.', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='visitor_access_requests', to='accounts.roombooking', verbose_name='Linked meeting'),
+        ),
+        migrations.AlterField(
+            model_name='visitor',
+            name='department_to_visit',
+            field=models.CharField(blank=True, max_length=200),
+        ),
+        migrations.AlterField(
+            model_name='visitor',
+            name='id_number',
+            field=models.CharField(blank=True, max_length=50),
+        ),
+        migrations.AlterField(
+            model_name='visitor',
+            name='phone',
+            field=models.CharField(blank=True, max_length=20),
+        ),
+        migrations.AlterField(
+            model_name='visitorlog',
+            name='action',
+            field=models.CharField(choices=[('check_in', 'Check In'), ('check_out', 'Check Out'), ('approval', 'Approved'), ('rejection', 'Rejected'), ('member_check_in', 'Member Check In'), ('member_check_out', 'Member Check Out'), ('gate_flag', 'Flagged for Attention'), ('gate_cleared', 'Attention Cleared')], max_length=20),
+        ),
+        migrations.CreateModel(
+            name='VisitorCard',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('number', models.CharField(max_length=20, unique=True)),
+                ('is_active', models.BooleanField(default=True)),
+                ('in_use', models.BooleanField(default=False)),
+                ('issued_at', models.DateTimeField(blank=True, null=True)),
+                ('returned_at', models.DateTimeField(blank=True, null=True)),
+                ('issued_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='visitor_cards_issued', to=settings.AUTH_USER_MODEL)),
+                ('issued_to', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='issued_card_history', to='visitors.visitor')),
+                ('returned_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='visitor_cards_returned', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['number'],
+            },
+        ),
+        migrations.CreateModel(
+            name='GroupMember',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('full_name', models.CharField(help_text='Full name as shown on ID', max_length=200)),
+                ('contact_number', models.CharField(blank=True, help_text='Phone or mobile number', max_length=20)),
+                ('email', models.EmailField(blank=True, help_text='Email address (optional)', max_length=254)),
+                ('id_type', models.CharField(choices=[('passport', 'Passport'), ('national_id', 'National ID Card'), ('driving_license', 'Driving License'), ('other', 'Other Photo ID')], default='other', help_text='Type of identification', max_length=20)),
+                ('id_number', models.CharField(blank=True, help_text='ID/Passport number (can be filled at gate)', max_length=100)),
+                ('nationality', models.CharField(blank=True, max_length=100)),
+                ('id_photo', models.ImageField(blank=True, help_text='Photo of ID document or face photo taken at gate', null=True, upload_to='group_members/ids/%Y/%m/')),
+                ('added_at', models.DateTimeField(auto_now_add=True)),
+                ('notes', models.TextField(blank=True, help_text='Additional notes about this member')),
+                ('checked_in', models.BooleanField(default=False)),
+                ('check_in_time', models.DateTimeField(blank=True, null=True)),
+                ('checked_out', models.BooleanField(default=False)),
+                ('check_out_time', models.DateTimeField(blank=True, null=True)),
+                ('gate_attention', models.CharField(choices=[('ok', 'OK'), ('needs_attention', 'Needs Attention'), ('cleared', 'Cleared by Host')], default='ok', max_length=20)),
+                ('gate_attention_note', models.TextField(blank=True, help_text='Reason for flagging this person for host attention.')),
+                ('gate_attention_raised_at', models.DateTimeField(blank=True, null=True)),
+                ('gate_attention_cleared_at', models.DateTimeField(blank=True, null=True)),
+                ('meeting_attendee_id', models.PositiveIntegerField(blank=True, db_index=True, help_text='PK of the MeetingAttendee this record was synced from (if any).', null=True)),
+                ('assigned_card', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='member_holders', to='visitors.visitorcard')),
+                ('visitor', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='group_members', to='visitors.visitor')),
+            ],
+            options={
+                'verbose_name': 'Group Member',
+                'verbose_name_plural': 'Group Members',
+                'ordering': ['full_name'],
+            },
+        ),
+        migrations.AddField(
+            model_name='visitor',
+            name='visitor_card',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='current_holder', to='visitors.visitorcard'),
+        ),
+        migrations.AddField(
+            model_name='visitorlog',
+            name='card',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='logs', to='visitors.visitorcard'),
+        ),
+        migrations.AddField(
+            model_name='visitorlog',
+            name='group_member',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='logs', to='visitors.groupmember'),
+        ),
+    ]
@@ -0,0 +1,15 @@
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    # Kept on its own: the index migrations that need pg_trgm run with
+    # atomic = False so they can build CONCURRENTLY.
+    dependencies = [
+        ('visitors', '0002_sync_schema_with_models'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+    ]
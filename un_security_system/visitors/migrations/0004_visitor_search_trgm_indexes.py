@@ -0,0 +1,38 @@
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations
+from django.db.models.functions import Upper
+
+
+class Migration(migrations.Migration):
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction; building
+    # without it would block writes to the visitor table for the whole build.
+    atomic = False
+
+    dependencies = [
+        ('visitors', '0003_trigram_extension'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='visitor',
+            index=GinIndex(OpClass(Upper('full_name'), name='gin_trgm_ops'), name='visitor_full_name_trgm'),
+        ),
+        AddIndexConcurrently(
+            model_name='visitor',
+            index=GinIndex(OpClass(Upper('organization'), name='gin_trgm_ops'), name='visitor_organization_trgm'),
+        ),
+        AddIndexConcurrently(
+            model_name='visitor',
+            index=GinIndex(OpClass(Upper('id_number'), name='gin_trgm_ops'), name='visitor_id_number_trgm'),
+        ),
+        AddIndexConcurrently(
+            model_name='visitor',
+            index=GinIndex(OpClass(Upper('phone'), name='gin_trgm_ops'), name='visitor_phone_trgm'),
+        ),
+        AddIndexConcurrently(
+            model_name='visitor',
+            index=GinIndex(OpClass(Upper('vehicle_plate'), name='gin_trgm_ops'), name='visitor_vehicle_plate_trgm'),
+        ),
+    ]
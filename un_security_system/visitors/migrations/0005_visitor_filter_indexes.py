@@ -0,0 +1,37 @@
+from django.conf import settings
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction.
+    atomic = False
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('visitors', '0004_visitor_search_trgm_indexes'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='visitor',
+            index=models.Index(fields=['-registered_at'], name='visitor_registered_at_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='visitor',
+            index=models.Index(fields=['status', '-registered_at'], name='visitor_status_reg_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='visitor',
+            index=models.Index(fields=['checked_in', 'checked_out'], name='visitor_presence_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='visitor',
+            index=models.Index(fields=['registered_by', '-registered_at'], name='visitor_reg_by_reg_at_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='visitor',
+            index=models.Index(fields=['check_out_time'], name='visitor_check_out_time_idx'),
+        ),
+    ]
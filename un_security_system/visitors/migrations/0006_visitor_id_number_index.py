@@ -0,0 +1,19 @@
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction.
+    atomic = False
+
+    dependencies = [
+        ('visitors', '0005_visitor_filter_indexes'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='visitor',
+            index=models.Index(fields=['id_number'], name='visitor_id_number_idx'),
+        ),
+    ]
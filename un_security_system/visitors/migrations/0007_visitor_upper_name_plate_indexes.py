@@ -0,0 +1,24 @@
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+from django.db.models.functions import Upper
+
+
+class Migration(migrations.Migration):
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction.
+    atomic = False
+
+    dependencies = [
+        ('visitors', '0006_visitor_id_number_index'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='visitor',
+            index=models.Index(Upper('full_name'), name='visitor_full_name_upper_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='visitor',
+            index=models.Index(Upper('vehicle_plate'), name='visitor_plate_upper_idx'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction.
+    atomic = False
+
+    dependencies = [
+        ('visitors', '0007_visitor_upper_name_plate_indexes'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='visitorlog',
+            index=models.Index(fields=['visitor', '-timestamp'], name='visitorlog_visitor_ts_idx'),
+        ),
+    ]
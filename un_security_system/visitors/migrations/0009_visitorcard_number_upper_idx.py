@@ -0,0 +1,20 @@
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+from django.db.models.functions import Upper
+
+
+class Migration(migrations.Migration):
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction.
+    atomic = False
+
+    dependencies = [
+        ('visitors', '0008_visitorlog_visitor_ts_idx'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='visitorcard',
+            index=models.Index(Upper('number'), name='visitorcard_number_upper_idx'),
+        ),
+    ]
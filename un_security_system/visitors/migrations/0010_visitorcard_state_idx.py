@@ -0,0 +1,19 @@
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction.
+    atomic = False
+
+    dependencies = [
+        ('visitors', '0009_visitorcard_number_upper_idx'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='visitorcard',
+            index=models.Index(fields=['is_active', 'in_use', 'number'], name='visitorcard_state_idx'),
+        ),
+    ]
@@ -0,0 +1,22 @@
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations
+from django.db.models.functions import Upper
+
+
+class Migration(migrations.Migration):
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction.
+    atomic = False
+
+    # pg_trgm is created by 0003_trigram_extension.
+    dependencies = [
+        ('visitors', '0010_visitorcard_state_idx'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='visitorcard',
+            index=GinIndex(OpClass(Upper('number'), name='gin_trgm_ops'), name='visitorcard_number_trgm'),
+        ),
+    ]
@@ -1,4 +1,6 @@
 from django.db import models
+from django.db.models.functions import Upper
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.conf import settings
 from django.utils import timezone
 from django.contrib.auth import get_user_model
@@ -20,6 +22,11 @@ class Visitor(models.Model):
         ('contractor', 'Contractor'),
     ]
 
+    # Label lookups built once per class for the export/search payloads
+    # (get_FOO_display() rebuilds the choices dict on every call).
+    STATUS_LABELS = dict(APPROVAL_STATUS)
+    VISITOR_TYPE_LABELS = dict(VISITOR_TYPES)
+
     full_name = models.CharField(max_length=200)
     id_number = models.CharField(max_length=50, blank=True)
     phone = models.CharField(max_length=20, blank=True)
@@ -86,6 +93,27 @@ class Visitor(models.Model):
 
     class Meta:
         ordering = ['-registered_at']
+        indexes = [
+            # Trigram indexes on UPPER(col) back Django's ``__icontains``
+            # (which compiles to UPPER(col::text) LIKE UPPER('%q%')) so the
+            # visitor search/verify lookups no longer sequential-scan.
+            GinIndex(OpClass(Upper('full_name'), name='gin_trgm_ops'), name='visitor_full_name_trgm'),
+            GinIndex(OpClass(Upper('organization'), name='gin_trgm_ops'), name='visitor_organization_trgm'),
+            GinIndex(OpClass(Upper('id_number'), name='gin_trgm_ops'), name='visitor_id_number_trgm'),
+            GinIndex(OpClass(Upper('phone'), name='gin_trgm_ops'), name='visitor_phone_trgm'),
+            GinIndex(OpClass(Upper('vehicle_plate'), name='gin_trgm_ops'), name='visitor_vehicle_plate_trgm'),
+            # Hot filter/sort combinations of the list, stats, active and export views.
+            models.Index(fields=['-registered_at'], name='visitor_registered_at_idx'),
+            models.Index(fields=['status', '-registered_at'], name='visitor_status_reg_idx'),
+            models.Index(fields=['checked_in', 'checked_out'], name='visitor_presence_idx'),
+            models.Index(fields=['registered_by', '-registered_at'], name='visitor_reg_by_reg_at_idx'),
+            models.Index(fields=['check_out_time'], name='visitor_check_out_time_idx'),
+            # Exact id_number equality of the gate lookup.
+            models.Index(fields=['id_number'], name='visitor_id_number_idx'),
+            # B-tree on UPPER(col) for the verify lookup's __iexact equality.
+            models.Index(Upper('full_name'), name='visitor_full_name_upper_idx'),
+            models.Index(Upper('vehicle_plate'), name='visitor_plate_upper_idx'),
+        ]
 
     def __str__(self):
         return f"{self.full_name} - {self.organization}"
@@ -98,15 +126,28 @@ class Visitor(models.Model):
     def total_group_size(self):
         """Returns total number of people including main visitor and group members"""
         if self.visitor_type == 'group':
+            prefetched = self._prefetched_group_members()
+            if prefetched is not None:
+                return 1 + len(prefetched)
             return 1 + self.group_members.count()
         return 1
 
+    def _prefetched_group_members(self):
+        """Group members loaded via prefetch_related('group_members'), else None."""
+        return getattr(self, '_prefetched_objects_cache', {}).get('group_members')
+
     @property
     def members_checked_in_count(self):
+        prefetched = self._prefetched_group_members()
+        if prefetched is not None:
+            return sum(1 for m in prefetched if m.checked_in and not m.checked_out)
         return self.group_members.filter(checked_in=True, checked_out=False).count()
 
     @property
     def members_pending_count(self):
+        prefetched = self._prefetched_group_members()
+        if prefetched is not None:
+            return sum(1 for m in prefetched if not m.checked_in)
         return self.group_members.filter(checked_in=False).count()
 
     def clearance_is_active_today(self):
@@ -325,6 +366,10 @@ class VisitorLog(models.Model):
 
     class Meta:
         ordering = ['-timestamp']
+        indexes = [
+            # Per-visitor timeline: WHERE visitor_id = ? ORDER BY timestamp DESC LIMIT n
+            models.Index(fields=['visitor', '-timestamp'], name='visitorlog_visitor_ts_idx'),
+        ]
 
 
 class VisitorCard(models.Model):
@@ -342,6 +387,65 @@ class VisitorCard(models.Model):
 
     class Meta:
         ordering = ['number']
+        indexes = [
+            # Card list availability filters (available / in use / inactive),
+            # returned in number order straight from the index.
+            models.Index(fields=['is_active', 'in_use', 'number'], name='visitorcard_state_idx'),
+            # number__iexact compiles to UPPER(number) = UPPER(%s); the unique
+            # index on the raw column cannot serve it.
+            models.Index(Upper('number'), name='visitorcard_number_upper_idx'),
+            # Card list search (number__icontains); pg_trgm is enabled by
+            # 0003_trigram_extension.
+            GinIndex(OpClass(Upper('number'), name='gin_trgm_ops'), name='visitorcard_number_trgm'),
+        ]
 
     def __str__(self):
-        return self.number
\ No newline at end of file
+        return self.number
+
+    @classmethod
+    def issue(cls, number, visitor, user, when, label="Card"):
+        """
+        Issue card ``number`` to ``visitor`` with a compare-and-set UPDATE
+        (WHERE is_active AND NOT in_use) instead of SELECT ... FOR UPDATE
+        followed by save(). Returns the card (id/number loaded only).
+        Raises cls.DoesNotExist, or ValueError with a gate-facing message.
+        """
+        card = cls.objects.only('id', 'number', 'is_active', 'in_use').get(number__iexact=number)
+        claimed = cls.objects.filter(pk=card.pk, is_active=True, in_use=False).update(
+            in_use=True,
+            issued_to=visitor,
+            issued_at=when,
+            issued_by=user,
+            returned_at=None,
+            returned_by=None,
+        )
+        if not claimed:
+            if not card.is_active:
+                raise ValueError(f"{label} {card.number} is inactive.")
+            raise ValueError(f"{label} {card.number} is already in use.")
+        return card
+
+    @classmethod
+    def collect_from(cls, visitor, user, when):
+        """
+        Return every card currently issued to ``visitor`` in one UPDATE.
+        Returns the list of card numbers collected.
+
+        The held rows are locked first (call inside transaction.atomic), so a
+        concurrent check-out waits and then finds them already returned
+        instead of reporting the same cards as collected a second time.
+        """
+        held = list(
+            cls.objects.select_for_update()
+            .filter(issued_to=visitor, in_use=True)
+            .values_list('pk', 'number')
+        )
+        if not held:
+            return []
+        cls.objects.filter(pk__in=[pk for pk, _number in held], in_use=True).update(
+            in_use=False,
+            returned_at=when,
+            returned_by=user,
+            issued_to=None,
+        )
+        return [number for _pk, number in held]
\ No newline at end of file
@@ -0,0 +1,44 @@
+"""
+Role checks shared by views.py and views_member_actions.py.
+"""
+
+# Roles that see every visitor and may operate the gate.
+PRIVILEGED_ROLES = frozenset({'lsa', 'soc', 'data_entry'})
+
+
+def _memoized_role_check(user, attr, check):
+    """
+    Evaluate ``check(user)`` once per user instance and stash the boolean on
+    it. request.user lives for a single request, so the cache is scoped to
+    that request and never goes stale across role changes.
+    """
+    cached = getattr(user, attr, None)
+    if cached is None:
+        cached = bool(check(user))
+        setattr(user, attr, cached)
+    return cached
+
+
+def is_lsa(user):
+    return _memoized_role_check(
+        user, '_visitors_is_lsa',
+        lambda u: u.is_authenticated and u.role == 'lsa',
+    )
+
+
+def is_lsa_or_soc(user):
+    return _memoized_role_check(
+        user, '_visitors_is_lsa_or_soc',
+        lambda u: u.is_authenticated and u.role in ('lsa', 'soc'),
+    )
+
+
+def _is_privileged(user):
+    return _memoized_role_check(
+        user, '_visitors_is_privileged',
+        lambda u: u.is_superuser or getattr(u, 'role', None) in PRIVILEGED_ROLES,
+    )
+
+
+def _gate_role(user):
+    return user.is_authenticated and _is_privileged(user)
@@ -0,0 +1,144 @@
+"""
+visitors/tasks.py
+─────────────────
+Celery tasks for the visitor app. Discovered automatically by
+``un_security_system.celery``.
+"""
+import logging
+from smtplib import (
+    SMTPConnectError,
+    SMTPRecipientsRefused,
+    SMTPSenderRefused,
+    SMTPServerDisconnected,
+)
+
+from celery import shared_task
+from django.core.mail import EmailMessage, get_connection
+
+logger = logging.getLogger(__name__)
+
+# One SMTP session per worker process, reused across tasks so each email
+# costs a single DATA exchange instead of a TCP + TLS + AUTH handshake.
+_smtp_connection = None
+
+# Failures that mean the session itself is unusable, as opposed to a
+# problem with one message (e.g. a refused recipient).
+_CONNECTION_ERRORS = (SMTPServerDisconnected, SMTPConnectError, ConnectionError, TimeoutError)
+
+# Refusals the server will repeat on every attempt: retrying cannot help.
+_PERMANENT_ERRORS = (SMTPRecipientsRefused, SMTPSenderRefused)
+
+
+def _get_smtp_connection():
+    """
+    Return the worker's open SMTP connection, (re)opening it when it has
+    never been opened or the server has dropped it (NOOP fails).
+    """
+    global _smtp_connection
+    conn = _smtp_connection
+    if conn is not None:
+        if not hasattr(conn, 'connection'):
+            # Non-SMTP backend (console, locmem): nothing to keep alive.
+            return conn
+        try:
+            if conn.connection is not None:
+                conn.connection.noop()
+                return conn
+        except Exception:
+            try:
+                conn.close()
+            except Exception:
+                pass
+    conn = get_connection(fail_silently=False)
+    conn.open()
+    _smtp_connection = conn
+    return conn
+
+
+def _drop_smtp_connection():
+    """Close and forget the worker's SMTP connection so the next use reopens it."""
+    global _smtp_connection
+    conn, _smtp_connection = _smtp_connection, None
+    if conn is not None:
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+
+@shared_task(
+    bind=True,
+    ignore_result=True,
+    autoretry_for=_CONNECTION_ERRORS,
+    retry_backoff=True,
+    max_retries=5,
+)
+def send_mail_task(self, subject, message, from_email, recipients, bcc=None):
+    """
+    Deliver a notification email from the worker. Dropped sessions and
+    failed connects are retried with exponential backoff; a refused sender
+    or recipient is logged and dropped, since a retry would be refused too.
+    """
+    try:
+        EmailMessage(
+            subject, message, from_email, recipients, bcc=bcc,
+            connection=_get_smtp_connection(),
+        ).send()
+    except _PERMANENT_ERRORS as exc:
+        logger.warning("Email to %s refused, dropping it: %s", recipients, exc)
+    except _CONNECTION_ERRORS:
+        # Reopen the session on the retry instead of reusing a dead one.
+        _drop_smtp_connection()
+        raise
+
+
+@shared_task(ignore_result=True)
+def send_mail_batch_task(batch):
+    """
+    Deliver several notifications over one SMTP session. ``batch`` is a
+    list of ``(subject, message, from_email, recipients)`` tuples.
+
+    If the server drops the session mid-batch it is reopened once. Anything
+    that still cannot be sent is handed to ``send_mail_task`` one message at
+    a time, so it gets that task's retries instead of being dropped.
+    """
+    reconnected = False
+    for index, (subject, message, from_email, recipients) in enumerate(batch):
+        try:
+            EmailMessage(
+                subject, message, from_email, recipients,
+                connection=_get_smtp_connection(),
+            ).send()
+            continue
+        except _PERMANENT_ERRORS as exc:
+            logger.warning("Batch email to %s refused, dropping it: %s", recipients, exc)
+            continue
+        except _CONNECTION_ERRORS as exc:
+            error = exc
+            if not reconnected:
+                reconnected = True
+                _drop_smtp_connection()
+                try:
+                    EmailMessage(
+                        subject, message, from_email, recipients,
+                        connection=_get_smtp_connection(),
+                    ).send()
+                    continue
+                except _PERMANENT_ERRORS as retry_exc:
+                    logger.warning(
+                        "Batch email to %s refused, dropping it: %s", recipients, retry_exc,
+                    )
+                    continue
+                except Exception as retry_exc:
+                    error = retry_exc
+            # The session is gone for good: queue the rest individually.
+            logger.warning(
+                "Email batch lost its SMTP session (%s); re-queuing %d message(s)",
+                error, len(batch) - index,
+            )
+            for item in batch[index:]:
+                send_mail_task.delay(*item)
+            return
+        except Exception as exc:
+            logger.warning("Batch email to %s failed, re-queuing it: %s", recipients, exc)
+            send_mail_task.delay(subject, message, from_email, recipients)
@@ -5,27 +5,31 @@ from django.views.generic import ListView, CreateView, UpdateView, DetailView
 from django.contrib import messages
 from django.urls import reverse_lazy, reverse
 from django.utils import timezone
-from django.http import JsonResponse, HttpResponse
-from django.db.models import Q, Count
+from django.utils.dateparse import parse_date
+from django.http import JsonResponse, Http404, StreamingHttpResponse
+from django.db.models import Q, Count, Prefetch, Case, When, Value, IntegerField
 from django.db import transaction, IntegrityError
 from django.views.decorators.http import require_http_methods, require_POST
 from django.core.paginator import Paginator
+from django.core.cache import cache
 from django.utils.decorators import method_decorator
-from datetime import timedelta
+from datetime import datetime, time, timedelta
 from dateutil.relativedelta import relativedelta
 import csv
-import threading
+import hashlib
 import logging
 from django.views.generic import TemplateView
 
 from django.core.files.uploadedfile import UploadedFile
 
 from django.conf import settings
-from django.core.mail import send_mail
+from django.core.mail import EmailMessage
 from django.contrib.auth import get_user_model
 
 from .models import Visitor, VisitorLog, VisitorCard, GroupMember
 from .forms import VisitorForm, VisitorApprovalForm, QuickVisitorCheckForm, GateCheckForm
+from .roles import is_lsa_or_soc, _is_privileged, _gate_role
+from .tasks import send_mail_batch_task, send_mail_task
 
 # ── Member gate-action views (imported so urls.py can use a single views module)
 from .views_member_actions import (
@@ -44,26 +48,56 @@ logger = logging.getLogger(__name__)
 
 User = get_user_model()
 
-# -------------------------------------------------------------------
-# Helper functions
-# -------------------------------------------------------------------
+# Choice lookups built once at import time instead of per row / per request.
+VISITOR_TYPE_KEYS = tuple(key for key, _label in Visitor.VISITOR_TYPES)
+VALID_STATUSES = frozenset(Visitor.STATUS_LABELS)
 
-def is_lsa(user):
-    return user.is_authenticated and user.role == 'lsa'
+# Shortest query visitor_search_api will run against the database.
+VISITOR_SEARCH_MIN_LENGTH = 3
 
+# Seconds a repeated search/verify lookup by the same user is served from
+# cache (absorbs autocomplete keystroke bursts and rescans at the gate).
+VISITOR_SEARCH_CACHE_TTL = 5
 
-def is_lsa_or_soc(user):
-    return user.is_authenticated and user.role in ['lsa', 'soc']
+# Log entries shown in the visitor detail timeline (matches the template slice).
+VISITOR_DETAIL_LOG_LIMIT = 8
 
+# Most recent log entries listed on a visitor card's detail page.
+CARD_HISTORY_LIMIT = 100
 
-def _gate_role(user):
-    return user.is_authenticated and (
-        getattr(user, 'role', None) in ('data_entry', 'lsa', 'soc') or user.is_superuser
-    )
+# visitor_card_list ?filter= values; the same conditions feed its header counters.
+CARD_LIST_FILTERS = {
+    'available': Q(is_active=True, in_use=False),
+    'in_use': Q(is_active=True, in_use=True),
+    'inactive': Q(is_active=False),
+}
+
+# Seconds visitor_card_check_api may serve a cached availability hint.
+CARD_CHECK_CACHE_TTL = 2
+
+# Seconds visitor_stats_api may serve a cached snapshot.
+VISITOR_STATS_CACHE_TTL = 30
+
+# Seconds the LSA/SOC recipient list for notifications may be reused.
+LSA_SOC_EMAILS_CACHE_TTL = 60
+
+# Seconds VisitorReportView may serve cached figures.
+VISITOR_REPORT_CACHE_TTL = 30
+
+# -------------------------------------------------------------------
+# Helper functions
+# -------------------------------------------------------------------
+
+def _notification_from_email():
+    return getattr(settings, "DEFAULT_FROM_EMAIL", None) or getattr(settings, "EMAIL_HOST_USER", None)
 
 
-def _send_notification(subject: str, message: str, recipients):
-    from_email = getattr(settings, "DEFAULT_FROM_EMAIL", None) or getattr(settings, "EMAIL_HOST_USER", None)
+def _send_notification(subject: str, message: str, recipients, bcc: bool = False):
+    """
+    Queue one email after commit. With ``bcc`` the recipients are blind-copied
+    so a single message can go to a whole role without exposing addresses.
+    """
+    from_email = _notification_from_email()
     if not from_email:
         return
 
@@ -74,37 +108,51 @@ def _send_notification(subject: str, message: str, recipients):
     if not emails:
         return
 
-    def _worker():
+    to, blind = ([], emails) if bcc else (emails, None)
+
+    def _dispatch():
         try:
-            send_mail(
-                subject=subject,
-                message=message,
-                from_email=from_email,
-                recipient_list=emails,
-                fail_silently=False,
-            )
+            send_mail_task.delay(subject, message, from_email, to, bcc=blind)
         except Exception as exc:
-            logger.exception("Background email send failed: %s", exc)
+            logger.warning("Could not queue notification email, sending inline: %s", exc)
+            EmailMessage(subject, message, from_email, to, bcc=blind).send(fail_silently=True)
 
-    t = threading.Thread(target=_worker, daemon=True)
-    t.start()
+    # Never announce a change that ends up rolled back.
+    transaction.on_commit(_dispatch)
 
 
-def _notify_lsa_soc_new_request(visitor, request):
-    base_qs = User.objects.filter(role__in=['lsa', 'soc'], is_active=True)
-    if visitor.registered_by and getattr(visitor.registered_by, "agency_id", None):
-        base_qs = base_qs.filter(agency_id=visitor.registered_by.agency_id)
+def _lsa_soc_emails(visitor):
+    """
+    Active LSA/SOC addresses for the visitor's agency (or all agencies),
+    cached briefly since every request/cancel notice needs the same list.
+    """
+    requester = visitor.registered_by
+    agency_id = getattr(requester, "agency_id", None) if requester else None
 
-    recipients = list(base_qs.values_list('email', flat=True))
-    if not recipients:
-        return
+    def _load():
+        qs = User.objects.filter(role__in=['lsa', 'soc'], is_active=True)
+        if agency_id:
+            qs = qs.filter(agency_id=agency_id)
+        return list(qs.values_list('email', flat=True))
 
+    return cache.get_or_set(f"visitors:lsa_soc_emails:{agency_id or 'all'}", _load, LSA_SOC_EMAILS_CACHE_TTL)
+
+
+def _visitor_detail_url(visitor, request):
     try:
-        detail_url = request.build_absolute_uri(
+        return request.build_absolute_uri(
             reverse('visitors:visitor_detail', kwargs={'pk': visitor.pk})
         )
     except Exception:
-        detail_url = ""
+        return ""
+
+
+def _notify_lsa_soc_new_request(visitor, request):
+    recipients = _lsa_soc_emails(visitor)
+    if not recipients:
+        return
+
+    detail_url = _visitor_detail_url(visitor, request)
 
     subject = f"[Visitor] New request: {visitor.full_name}"
     message = (
@@ -120,13 +168,59 @@ def _notify_lsa_soc_new_request(visitor, request):
         f"You can review this request here:\n{detail_url}\n\n"
         f"Best regards,\nUN Security / Common Services System"
     )
-    _send_notification(subject, message, recipients)
+    # One message to the whole role, addresses blind-copied.
+    _send_notification(subject, message, recipients, bcc=True)
 
 
-def _notify_requester_status_change(visitor, status_label: str, extra_notes: str = ""):
+def _notify_lsa_soc_cancelled(visitor, request):
+    recipients = _lsa_soc_emails(visitor)
+    if not recipients:
+        return
+
+    subject = f"[Visitor] Request cancelled: {visitor.full_name}"
+    message = (
+        f"Dear LSA/SOC,\n\n"
+        f"The visitor request below has been cancelled by "
+        f"{request.user.get_full_name() or request.user.username}. No action is needed.\n\n"
+        f"Visitor: {visitor.full_name}\n"
+        f"Organization: {visitor.organization or 'N/A'}\n"
+        f"Expected date/time: {visitor.expected_date} {visitor.expected_time}\n\n"
+        f"{_visitor_detail_url(visitor, request)}\n\n"
+        f"Best regards,\nUN Security / Common Services System"
+    )
+    _send_notification(subject, message, recipients, bcc=True)
+
+
+def _send_notification_batch(batch):
+    """
+    Queue several ``(subject, message, recipients)`` notifications as one
+    worker task delivered over a single SMTP session, after commit.
+    """
+    from_email = _notification_from_email()
+    if not from_email or not batch:
+        return
+
+    payload = [(subject, message, from_email, recipients) for subject, message, recipients in batch]
+
+    def _dispatch():
+        try:
+            send_mail_batch_task.delay(payload)
+        except Exception as exc:
+            logger.warning("Could not queue notification batch, sending inline: %s", exc)
+            try:
+                send_mail_batch_task(payload)
+            except Exception:
+                # Re-queuing a failed message needs the broker we just lost.
+                logger.exception("Inline notification batch did not complete")
+
+    transaction.on_commit(_dispatch)
+
+
+def _requester_status_email(visitor, status_label: str, extra_notes: str = ""):
+    """(subject, message, [email]) for a status-change notice, or None if there is no requester email."""
     requester = getattr(visitor, "registered_by", None)
     if not requester or not requester.email:
-        return
+        return None
 
     subject = f"[Visitor] Request {status_label}: {visitor.full_name}"
     message = (
@@ -140,7 +234,13 @@ def _notify_requester_status_change(visitor, status_label: str, extra_notes: str
     if extra_notes:
         message += f"Notes: {extra_notes}\n\n"
     message += "Best regards,\nUN Security / Common Services System"
-    _send_notification(subject, message, requester.email)
+    return subject, message, [requester.email]
+
+
+def _notify_requester_status_change(visitor, status_label: str, extra_notes: str = ""):
+    email = _requester_status_email(visitor, status_label, extra_notes)
+    if email:
+        _send_notification(*email)
 
 
 def _notify_requester_check_in(visitor, gate=None):
@@ -179,6 +279,80 @@ def _notify_requester_check_out(visitor, gate=None, duration_str=None):
     _send_notification(subject, message, requester.email)
 
 
+def _visitor_search_q(term, prefix_ids=False):
+    """
+    Free-text match used by the visitor list and the search API. Keep the
+    lookup logic here so an index-backed search only needs changing once.
+
+    With ``prefix_ids`` the identifier columns (ID number, phone) match on
+    prefix only, which is what people type into an autocomplete box and is
+    far more selective against the trigram indexes.
+    """
+    id_lookup = 'istartswith' if prefix_ids else 'icontains'
+    return (
+        Q(full_name__icontains=term) |
+        Q(organization__icontains=term) |
+        Q(**{f'id_number__{id_lookup}': term}) |
+        Q(**{f'phone__{id_lookup}': term})
+    )
+
+
+def _search_cache_key(kind, query, user=None):
+    """
+    Cache key for a lookup; the query is hashed to keep keys short and safe.
+    Pass ``user`` when the result depends on who is asking, otherwise the
+    entry is shared by everyone typing the same query.
+    """
+    digest = hashlib.md5(query.lower().encode('utf-8'), usedforsecurity=False).hexdigest()
+    scope = user.pk if user is not None else 'all'
+    return f"visitors:{kind}:{scope}:{digest}"
+
+
+def _parse_pk(raw):
+    """
+    Return ``raw`` as an int primary key if it is a plain ASCII digit string
+    short enough to fit a bigint, else None (no overflowing or unicode-digit
+    values reach the database).
+    """
+    if raw and raw.isascii() and raw.isdigit() and len(raw) <= 18:
+        return int(raw)
+    return None
+
+
+def _pk_priority_lookup(text_q, raw, *ordering):
+    """
+    Single-query "id first, then text match" lookup: OR an exact pk match on
+    ``raw`` (when it looks like an id) into ``text_q`` and sort that row
+    ahead of the rest. Returns (queryset, pk or None).
+    """
+    pk = _parse_pk(raw)
+    if pk is None:
+        return Visitor.objects.filter(text_q).order_by(*ordering), None
+
+    qs = Visitor.objects.filter(text_q | Q(pk=pk)).annotate(
+        pk_priority=Case(When(pk=pk, then=Value(0)), default=Value(1), output_field=IntegerField())
+    ).order_by('pk_priority', *ordering)
+    return qs, pk
+
+
+def _day_bounds(day):
+    """
+    Aware [start, end) datetimes covering ``day`` in the current timezone.
+    Filtering on this range keeps plain B-tree indexes usable, unlike
+    ``field__date=day`` which wraps the column in a date cast.
+    """
+    start = timezone.make_aware(datetime.combine(day, time.min))
+    return start, start + timedelta(days=1)
+
+
+def _parse_date_param(raw):
+    """Parse a YYYY-MM-DD query parameter, returning None if missing or invalid."""
+    try:
+        return parse_date(raw) if raw else None
+    except ValueError:
+        return None
+
+
 def _compute_valid_until(start_date, value: int, unit: str):
     if unit == "days":
         return start_date + timedelta(days=value)
@@ -189,7 +363,7 @@ def _compute_valid_until(start_date, value: int, unit: str):
     return start_date
 
 
-def _apply_clearance_window_from_post(visitor, request):
+def _apply_clearance_window_from_post(visitor, request, today=None):
     val = (request.POST.get("clearance_value") or "").strip()
     unit = (request.POST.get("clearance_unit") or "").strip().lower()
 
@@ -203,7 +377,7 @@ def _apply_clearance_window_from_post(visitor, request):
     except Exception:
         return
 
-    start = timezone.now().date()
+    start = today or timezone.localdate()
     visitor.clearance_valid_from = start
     visitor.clearance_valid_until = _compute_valid_until(start, value, unit)
 
@@ -242,6 +416,23 @@ def _sync_visitor_from_meeting(visitor, performed_by=None):
     return created, updated
 
 
+class PkSubqueryPaginator(Paginator):
+    """
+    Paginator that resolves a page as ``WHERE pk IN (SELECT pk ... LIMIT/OFFSET)``.
+    The sort + OFFSET runs over the narrow pk column only; full rows are
+    fetched just for the page being shown, which keeps deep pages cheap.
+    """
+
+    def page(self, number):
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        top = bottom + self.per_page
+        if top + self.orphans >= self.count:
+            top = self.count
+        page_pks = self.object_list.values('pk')[bottom:top]
+        return self._get_page(self.object_list.filter(pk__in=page_pks), number, self)
+
+
 # -------------------------------------------------------------------
 # Views
 # -------------------------------------------------------------------
@@ -251,13 +442,28 @@ class VisitorListView(LoginRequiredMixin, ListView):
     template_name = 'visitors/visitor_list.html'
     context_object_name = 'visitors'
     paginate_by = 20
+    paginator_class = PkSubqueryPaginator
+
+    # Columns read by visitor_list.html — keep in sync with the template.
+    list_columns = (
+        'id', 'full_name', 'organization', 'id_number', 'phone',
+        'person_to_visit', 'purpose_of_visit', 'visitor_type', 'status',
+        'checked_in', 'checked_out', 'check_in_time', 'check_out_time',
+        'registered_at',
+    )
 
     def get_queryset(self):
         user = self.request.user
-        qs = Visitor.objects.all()
+        # The list renders per-row group member in/out counts; prefetch the
+        # few columns needed so that is one query per page instead of ~3 per row.
+        qs = Visitor.objects.prefetch_related(
+            Prefetch(
+                'group_members',
+                queryset=GroupMember.objects.only('id', 'visitor_id', 'checked_in', 'checked_out'),
+            )
+        ).only(*self.list_columns)
 
-        privileged_roles = {'lsa', 'soc', 'data_entry'}
-        is_privileged = user.is_superuser or getattr(user, 'role', None) in privileged_roles
+        is_privileged = _is_privileged(user)
 
         if not is_privileged:
             qs = qs.filter(registered_by=user)
@@ -267,41 +473,53 @@ class VisitorListView(LoginRequiredMixin, ListView):
         search = (self.request.GET.get('search') or '').strip()
         date_range = self.request.GET.get('date_range') or ''
 
-        valid_statuses = {choice[0] for choice in getattr(Visitor, 'APPROVAL_STATUS', [])}
-
-        if filter_status and (not status_filter) and filter_status in valid_statuses:
+        if filter_status and (not status_filter) and filter_status in VALID_STATUSES:
             qs = qs.filter(status=filter_status)
-        elif status_filter and status_filter in valid_statuses:
+        elif status_filter and status_filter in VALID_STATUSES:
             qs = qs.filter(status=status_filter)
 
         if date_range:
-            today = timezone.now().date()
+            today = timezone.localdate()
+            start = None
             if date_range == 'today':
-                qs = qs.filter(registered_at__date=today)
+                start = today
             elif date_range == 'week':
-                start = today - timezone.timedelta(days=7)
-                qs = qs.filter(registered_at__date__gte=start, registered_at__date__lte=today)
+                start = today - timedelta(days=7)
             elif date_range == 'month':
                 start = today.replace(day=1)
-                qs = qs.filter(registered_at__date__gte=start, registered_at__date__lte=today)
+            if start is not None:
+                qs = qs.filter(
+                    registered_at__gte=_day_bounds(start)[0],
+                    registered_at__lt=_day_bounds(today)[1],
+                )
 
         if search:
-            qs = qs.filter(
-                Q(full_name__icontains=search) |
-                Q(organization__icontains=search) |
-                Q(id_number__icontains=search) |
-                Q(phone__icontains=search)
-            )
+            qs = qs.filter(_visitor_search_q(search))
 
         return qs.order_by('-registered_at')
 
+    def get_paginator(self, queryset, per_page, orphans=0, allow_empty_first_page=True, **kwargs):
+        paginator = super().get_paginator(queryset, per_page, orphans, allow_empty_first_page, **kwargs)
+        counts = getattr(self, 'list_counts', None)
+        if counts is not None:
+            # Seed Paginator.count (a cached_property) from the aggregate
+            # below instead of letting it run its own COUNT(*).
+            paginator.__dict__['count'] = counts['total']
+        return paginator
+
     def get_context_data(self, **kwargs):
+        # One pass over the filtered set for the header badges and the
+        # paginator total, instead of four separate COUNT queries.
+        self.list_counts = self.object_list.order_by().aggregate(
+            total=Count('id'),
+            pending=Count('id', filter=Q(status='pending')),
+            approved=Count('id', filter=Q(status='approved')),
+            checked_in=Count('id', filter=Q(checked_in=True, checked_out=False)),
+        )
         ctx = super().get_context_data(**kwargs)
         user = self.request.user
-        privileged_roles = {'lsa', 'soc', 'data_entry'}
-        mine_only = not (user.is_superuser or getattr(user, 'role', None) in privileged_roles)
-
-        qs = self.object_list
+        mine_only = not _is_privileged(user)
+        counts = self.list_counts
 
         ctx.update({
             'status_filter': self.request.GET.get('status_filter', ''),
@@ -309,10 +527,10 @@ class VisitorListView(LoginRequiredMixin, ListView):
             'filter_status': self.kwargs.get('filter_status', ''),
             'status_choices': getattr(Visitor, 'APPROVAL_STATUS', []),
             'mine_only': mine_only,
-            'total_count': qs.count(),
-            'pending_count': qs.filter(status='pending').count(),
-            'approved_count': qs.filter(status='approved').count(),
-            'checked_in_count': qs.filter(checked_in=True, checked_out=False).count(),
+            'total_count': counts['total'],
+            'pending_count': counts['pending'],
+            'approved_count': counts['approved'],
+            'checked_in_count': counts['checked_in'],
         })
         return ctx
 
@@ -325,16 +543,26 @@ class VisitorDetailView(LoginRequiredMixin, DetailView):
     def get_queryset(self):
         user = self.request.user
         qs = super().get_queryset()
-        privileged_roles = {'lsa', 'soc', 'data_entry'}
-        if not (user.is_superuser or getattr(user, 'role', None) in privileged_roles):
+        if not _is_privileged(user):
             qs = qs.filter(registered_by=user)
-        return qs
+        return qs.prefetch_related(
+            # The template reads group_members.all/count/exists and the
+            # member counters several times; one query serves all of them.
+            Prefetch(
+                'group_members',
+                queryset=GroupMember.objects.select_related('assigned_card'),
+            ),
+        )
 
     def get_context_data(self, **kwargs):
         ctx = super().get_context_data(**kwargs)
-        ctx['logs'] = VisitorLog.objects.filter(
-            visitor=self.object
-        ).select_related('performed_by').order_by('-timestamp')
+        # Only the latest few entries are shown; fetch just those rather than
+        # the visitor's whole history.
+        ctx['logs'] = list(
+            VisitorLog.objects.filter(visitor=self.object)
+            .select_related('performed_by')
+            .order_by('-timestamp')[:VISITOR_DETAIL_LOG_LIMIT]
+        )
 
         # Pass linked booking attendee count for the sync banner
         visitor = self.object
@@ -370,49 +598,54 @@ class VisitorCreateView(LoginRequiredMixin, CreateView):
 
     def form_valid(self, form):
         form.instance.registered_by = self.request.user
-        response = super().form_valid(form)
-        visitor = form.instance
-
-        member_count = 0
+        auto_approve = self.request.user.role == 'lsa'
 
-        # ── Meeting-link sync ──────────────────────────────────────────────
-        if visitor.linked_booking:
+        # Resolve everything known up front so the visitor is written with a
+        # single INSERT rather than INSERT + follow-up UPDATEs.
+        if form.instance.linked_booking_id and form.instance.visitor_type != 'group':
             # Ensure visitor_type is group when a meeting is linked
-            if visitor.visitor_type != 'group':
-                visitor.visitor_type = 'group'
-                visitor.save(update_fields=['visitor_type'])
+            form.instance.visitor_type = 'group'
+        if auto_approve:
+            form.instance.status = 'approved'
+            form.instance.approved_by = self.request.user
+            form.instance.approval_date = timezone.now()
+
+        # Visitor INSERT, member sync and audit logs commit together.
+        with transaction.atomic():
+            response = super().form_valid(form)
+            visitor = form.instance
+
+            member_count = 0
+
+            # ── Meeting-link sync ──────────────────────────────────────────
+            if visitor.linked_booking:
+                created, updated = _sync_visitor_from_meeting(visitor, self.request.user)
+                member_count = created
+
+                if created or updated:
+                    messages.info(
+                        self.request,
+                        f"Auto-imported {created} meeting registrant(s) as group members"
+                        + (f" ({updated} updated)." if updated else "."),
+                    )
 
-            created, updated = _sync_visitor_from_meeting(visitor, self.request.user)
-            member_count = created
+            # ── Manual group members from form ─────────────────────────────
+            elif visitor.visitor_type == 'group':
+                member_count = self._save_group_members(visitor)
 
-            if created or updated:
-                messages.info(
-                    self.request,
-                    f"Auto-imported {created} meeting registrant(s) as group members"
-                    + (f" ({updated} updated)." if updated else "."),
+            # Auto-approved by LSA (fields already set before the INSERT)
+            if auto_approve:
+                VisitorLog.objects.create(
+                    visitor=visitor,
+                    action='approval',
+                    performed_by=self.request.user,
+                    notes='Auto-approved by LSA'
                 )
 
-        # ── Manual group members from form ─────────────────────────────────
-        elif visitor.visitor_type == 'group':
-            member_count = self._save_group_members(visitor)
-
         # Notify LSA/SOC
         _notify_lsa_soc_new_request(visitor, self.request)
 
-        # Auto-approve if user is LSA
-        if self.request.user.role == 'lsa':
-            visitor.status = 'approved'
-            visitor.approved_by = self.request.user
-            visitor.approval_date = timezone.now()
-            visitor.save()
-
-            VisitorLog.objects.create(
-                visitor=visitor,
-                action='approval',
-                performed_by=self.request.user,
-                notes='Auto-approved by LSA'
-            )
-
+        if auto_approve:
             success_msg = f'Visitor {visitor.full_name} registered and approved successfully.'
             if member_count > 0:
                 success_msg += f' Group includes {member_count} member(s).'
@@ -460,14 +693,16 @@ class VisitorCreateView(LoginRequiredMixin, CreateView):
                 'notes': notes_list[idx].strip() if idx < len(notes_list) else '',
             }
 
-            try:
-                member = GroupMember.objects.create(**member_data)
-
-                if idx < len(id_photos) and id_photos[idx]:
-                    if id_photos[idx].size <= 5 * 1024 * 1024:
-                        member.id_photo = id_photos[idx]
-                        member.save()
+            # Attach the photo before the INSERT rather than re-saving the row.
+            if idx < len(id_photos) and id_photos[idx]:
+                if id_photos[idx].size <= 5 * 1024 * 1024:
+                    member_data['id_photo'] = id_photos[idx]
 
+            try:
+                # Savepoint per member: a bad row is skipped without
+                # poisoning the caller's transaction (visitor INSERT, logs).
+                with transaction.atomic():
+                    GroupMember.objects.create(**member_data)
                 saved_count += 1
             except Exception as e:
                 logger.error(f"Error saving group member: {e}")
@@ -576,14 +811,16 @@ class VisitorUpdateView(LoginRequiredMixin, UpdateView):
                 'notes': notes_list[idx].strip() if idx < len(notes_list) else '',
             }
 
-            try:
-                member = GroupMember.objects.create(**member_data)
-
-                if idx < len(id_photos) and id_photos[idx]:
-                    if id_photos[idx].size <= 5 * 1024 * 1024:
-                        member.id_photo = id_photos[idx]
-                        member.save()
+            # Attach the photo before the INSERT rather than re-saving the row.
+            if idx < len(id_photos) and id_photos[idx]:
+                if id_photos[idx].size <= 5 * 1024 * 1024:
+                    member_data['id_photo'] = id_photos[idx]
 
+            try:
+                # Savepoint per member: a bad row is skipped without
+                # poisoning the caller's transaction (visitor INSERT, logs).
+                with transaction.atomic():
+                    GroupMember.objects.create(**member_data)
                 saved_count += 1
             except Exception as e:
                 logger.error(f"Error saving group member: {e}")
@@ -666,14 +903,15 @@ def delete_group_member(request, visitor_id, member_id):
 
     if request.method == 'POST':
         member_name = member.full_name
-        member.delete()
+        with transaction.atomic():
+            member.delete()
 
-        VisitorLog.objects.create(
-            visitor=visitor,
-            action='approval',
-            performed_by=request.user,
-            notes=f'Removed group member: {member_name}'
-        )
+            VisitorLog.objects.create(
+                visitor=visitor,
+                action='approval',
+                performed_by=request.user,
+                notes=f'Removed group member: {member_name}'
+            )
 
         messages.success(request, f'Group member {member_name} removed successfully.')
         return redirect('visitors:visitor_detail', pk=visitor_id)
@@ -700,34 +938,47 @@ def approve_visitor(request, visitor_id):
             notes = form.cleaned_data.get('notes', '')
             rejection_reason = form.cleaned_data.get('rejection_reason', '')
 
-            if action == 'approve':
-                visitor.status = 'approved'
-                visitor.approved_by = request.user
-                visitor.approval_date = timezone.now()
-                visitor.save()
+            # Only a pending request can be decided; the filtered UPDATE makes
+            # the transition once even if two reviewers submit together.
+            pending = Visitor.objects.filter(pk=visitor.pk, status='pending')
 
-                VisitorLog.objects.create(
-                    visitor=visitor,
-                    action='approval',
-                    performed_by=request.user,
-                    notes=notes or 'Approved'
-                )
-                messages.success(request, f'Visitor {visitor.full_name} approved successfully.')
-                _notify_requester_status_change(visitor, 'approved', notes)
+            if action == 'approve':
+                now = timezone.now()
+                with transaction.atomic():
+                    changed = pending.update(status='approved', approved_by=request.user, approval_date=now)
+                    if changed:
+                        visitor.status = 'approved'
+                        visitor.approved_by = request.user
+                        visitor.approval_date = now
+                        VisitorLog.objects.create(
+                            visitor=visitor,
+                            action='approval',
+                            performed_by=request.user,
+                            notes=notes or 'Approved'
+                        )
+                if changed:
+                    messages.success(request, f'Visitor {visitor.full_name} approved successfully.')
+                    _notify_requester_status_change(visitor, 'approved', notes)
+                else:
+                    messages.warning(request, "Already processed.")
 
             elif action == 'reject':
-                visitor.status = 'rejected'
-                visitor.rejection_reason = rejection_reason
-                visitor.save()
-
-                VisitorLog.objects.create(
-                    visitor=visitor,
-                    action='rejection',
-                    performed_by=request.user,
-                    notes=rejection_reason
-                )
-                messages.warning(request, f'Visitor {visitor.full_name} has been rejected.')
-                _notify_requester_status_change(visitor, 'rejected', rejection_reason)
+                with transaction.atomic():
+                    changed = pending.update(status='rejected', rejection_reason=rejection_reason)
+                    if changed:
+                        visitor.status = 'rejected'
+                        visitor.rejection_reason = rejection_reason
+                        VisitorLog.objects.create(
+                            visitor=visitor,
+                            action='rejection',
+                            performed_by=request.user,
+                            notes=rejection_reason
+                        )
+                if changed:
+                    messages.warning(request, f'Visitor {visitor.full_name} has been rejected.')
+                    _notify_requester_status_change(visitor, 'rejected', rejection_reason)
+                else:
+                    messages.warning(request, "Already processed.")
 
             return redirect('visitors:visitor_detail', pk=visitor.pk)
     else:
@@ -777,31 +1028,50 @@ def check_in_visitor(request, visitor_id):
             status=400,
         )
 
-    visitor.checked_out = False
-    visitor.check_out_time = None
-    visitor.checked_in = True
-    visitor.check_in_time = timezone.now()
-    visitor.save()
-
-    note_parts = [f"Checked in at {visitor.check_in_time.strftime('%H:%M')}"]
-
-    if card:
-        note_parts.append(f"Card {card.number}")
-        effective_card_number = card.number
-    else:
-        note_parts.append(f"Card {card_number_input}")
-        effective_card_number = card_number_input
+    with transaction.atomic():
+        now = timezone.now()
+
+        # Conditional UPDATE: the WHERE clause re-checks state so two gate
+        # scans racing on the same visitor cannot both check them in.
+        claimed = Visitor.objects.filter(
+            pk=visitor.pk, status="approved", checked_in=False,
+        ).update(
+            checked_in=True,
+            checked_out=False,
+            check_in_time=now,
+            check_out_time=None,
+            id_number=visitor.id_number,
+        )
+        if not claimed:
+            # Lost a race with another gate (or approval was revoked meanwhile).
+            still_approved = Visitor.objects.filter(pk=visitor.pk, status="approved").exists()
+            error = "Visitor already checked in" if still_approved else "Visitor is not cleared for today."
+            return JsonResponse({"error": error}, status=400)
+
+        visitor.checked_out = False
+        visitor.check_out_time = None
+        visitor.checked_in = True
+        visitor.check_in_time = now
+
+        note_parts = [f"Checked in at {visitor.check_in_time.strftime('%H:%M')}"]
+
+        if card:
+            note_parts.append(f"Card {card.number}")
+            effective_card_number = card.number
+        else:
+            note_parts.append(f"Card {card_number_input}")
+            effective_card_number = card_number_input
 
-    note = " · ".join(note_parts)
+        note = " · ".join(note_parts)
 
-    VisitorLog.objects.create(
-        visitor=visitor,
-        card=card,
-        action="check_in",
-        performed_by=request.user,
-        gate=gate,
-        notes=note,
-    )
+        VisitorLog.objects.create(
+            visitor=visitor,
+            card=card,
+            action="check_in",
+            performed_by=request.user,
+            gate=gate,
+            notes=note,
+        )
 
     _notify_requester_check_in(visitor, gate=gate)
 
@@ -827,10 +1097,34 @@ def check_out_visitor(request, visitor_id):
 
     gate = request.POST.get("gate", "front")
 
-    visitor.checked_in = False
-    visitor.checked_out = True
-    visitor.check_out_time = timezone.now()
-    visitor.save()
+    with transaction.atomic():
+        now = timezone.now()
+
+        claimed = Visitor.objects.filter(
+            pk=visitor.pk, checked_in=True, checked_out=False,
+        ).update(
+            checked_in=False,
+            checked_out=True,
+            check_out_time=now,
+        )
+        if not claimed:
+            return JsonResponse({"error": "Visitor not currently checked in"}, status=400)
+
+        visitor.checked_in = False
+        visitor.checked_out = True
+        visitor.check_out_time = now
+
+        card = getattr(visitor, "visitor_card", None)
+        effective_card_number = card.number if card else "N/A"
+
+        VisitorLog.objects.create(
+            visitor=visitor,
+            card=card,
+            action="check_out",
+            performed_by=request.user,
+            gate=gate,
+            notes=f"Checked out at {visitor.check_out_time.strftime('%H:%M')}",
+        )
 
     duration = None
     duration_str = None
@@ -838,18 +1132,6 @@ def check_out_visitor(request, visitor_id):
         duration = visitor.check_out_time - visitor.check_in_time
         duration_str = str(duration).split(".")[0]
 
-    card = getattr(visitor, "visitor_card", None)
-    effective_card_number = card.number if card else "N/A"
-
-    VisitorLog.objects.create(
-        visitor=visitor,
-        card=card,
-        action="check_out",
-        performed_by=request.user,
-        gate=gate,
-        notes=f"Checked out at {visitor.check_out_time.strftime('%H:%M')}",
-    )
-
     _notify_requester_check_out(visitor, gate=gate, duration_str=duration_str)
 
     return JsonResponse(
@@ -871,14 +1153,18 @@ def quick_check_page(request):
 
 @login_required
 def active_visitors_view(request):
-    active_visitors = Visitor.objects.filter(
-        checked_in=True,
-        checked_out=False
-    ).select_related('registered_by')
+    # Evaluate once and reuse: the template iterates the rows anyway, so a
+    # separate COUNT(*) would be a wasted round trip.
+    active_visitors = list(
+        Visitor.objects.filter(
+            checked_in=True,
+            checked_out=False
+        ).select_related('registered_by')
+    )
 
     return render(request, 'visitors/active_visitors.html', {
         'visitors': active_visitors,
-        'total_active': active_visitors.count()
+        'total_active': len(active_visitors)
     })
 
 
@@ -923,20 +1209,22 @@ def quick_visitor_check(request):
 
         try:
             visitor = None
-            if visitor_id and visitor_id.isdigit():
-                try:
-                    visitor = Visitor.objects.get(id=visitor_id)
-                except Visitor.DoesNotExist:
-                    pass
-
-            if not visitor and visitor_id:
-                visitors = Visitor.objects.filter(
-                    Q(id_number=visitor_id) |
-                    Q(full_name__icontains=visitor_id)
+
+            if visitor_id:
+                # One bounded query covers the pk probe and the text fallback:
+                # an exact pk hit sorts first, otherwise we only need to know
+                # "none, one or many" plus up to 5 suggestions.
+                qs, pk = _pk_priority_lookup(
+                    Q(id_number=visitor_id) | Q(full_name__icontains=visitor_id),
+                    visitor_id,
+                    '-registered_at',
                 )
-                if visitors.count() == 1:
-                    visitor = visitors.first()
-                elif visitors.count() > 1:
+                matches = list(qs.only('id', 'full_name', 'organization', 'id_number')[:6])
+                if pk is not None and matches and matches[0].pk == pk:
+                    visitor = matches[0]
+                elif len(matches) == 1:
+                    visitor = matches[0]
+                elif len(matches) > 1:
                     return JsonResponse({
                         'error': 'Multiple visitors found. Please be more specific.',
                         'suggestions': [{
@@ -944,7 +1232,7 @@ def quick_visitor_check(request):
                             'name': v.full_name,
                             'org': v.organization,
                             'id_number': v.id_number
-                        } for v in visitors[:5]]
+                        } for v in matches[:5]]
                     })
                 else:
                     return JsonResponse({'error': 'Visitor not found'})
@@ -969,61 +1257,85 @@ def quick_visitor_check(request):
 def visitor_search_api(request):
     query = request.GET.get('q', '').strip()
 
-    if len(query) < 2:
+    # Trigram indexes cannot narrow patterns shorter than 3 characters.
+    if len(query) < VISITOR_SEARCH_MIN_LENGTH:
         return JsonResponse({'visitors': []})
 
-    visitors = Visitor.objects.filter(
-        Q(full_name__icontains=query) |
-        Q(id_number__icontains=query) |
-        Q(organization__icontains=query) |
-        Q(phone__icontains=query)
+    # Results are not scoped to the requesting user, so one entry serves
+    # every client typing the same query.
+    payload = cache.get_or_set(
+        _search_cache_key('search', query),
+        lambda: _visitor_search_payload(query),
+        VISITOR_SEARCH_CACHE_TTL,
+    )
+    return JsonResponse(payload)
+
+
+def _visitor_search_payload(query):
+    # Plain dict rows: no model instances are built for the typeahead.
+    rows = Visitor.objects.filter(_visitor_search_q(query, prefix_ids=True)).values(
+        'id', 'full_name', 'organization', 'id_number', 'status', 'checked_in', 'checked_out',
     )[:10]
 
-    return JsonResponse({
-        'visitors': [{
-            'id': visitor.id,
-            'full_name': visitor.full_name,
-            'organization': visitor.organization,
-            'id_number': visitor.id_number,
-            'status': visitor.get_status_display(),
-            'checked_in': visitor.checked_in,
-            'checked_out': visitor.checked_out
-        } for visitor in visitors]
-    })
+    return {
+        'visitors': [
+            {**row, 'status': Visitor.STATUS_LABELS.get(row['status'], row['status'])}
+            for row in rows
+        ]
+    }
 
 
 @login_required
 def visitor_stats_api(request):
-    today = timezone.now().date()
-
-    stats = {
-        'total_today': Visitor.objects.filter(registered_at__date=today).count(),
-        'pending': Visitor.objects.filter(status='pending').count(),
-        'approved': Visitor.objects.filter(status='approved').count(),
-        'rejected': Visitor.objects.filter(status='rejected').count(),
-        'active': Visitor.objects.filter(checked_in=True, checked_out=False).count(),
-        'completed_today': Visitor.objects.filter(check_out_time__date=today).count(),
-        'by_type': {
-            vtype[0]: Visitor.objects.filter(visitor_type=vtype[0]).count()
-            for vtype in Visitor.VISITOR_TYPES
-        }
-    }
-
+    today = timezone.localdate()
+
+    # Dashboard widgets poll this endpoint; the figures are global (not per
+    # user), so a short-lived shared cache entry absorbs the polling load.
+    stats = cache.get_or_set(
+        f"visitors:stats:{today.isoformat()}",
+        lambda: _compute_visitor_stats(today),
+        VISITOR_STATS_CACHE_TTL,
+    )
     return JsonResponse(stats)
 
 
+def _compute_visitor_stats(today):
+    day_start, day_end = _day_bounds(today)
+
+    # Headline counters and the per-type breakdown in one scan via
+    # conditional aggregation.
+    counts = Visitor.objects.aggregate(
+        total_today=Count('id', filter=Q(registered_at__gte=day_start, registered_at__lt=day_end)),
+        pending=Count('id', filter=Q(status='pending')),
+        approved=Count('id', filter=Q(status='approved')),
+        rejected=Count('id', filter=Q(status='rejected')),
+        active=Count('id', filter=Q(checked_in=True, checked_out=False)),
+        completed_today=Count('id', filter=Q(check_out_time__gte=day_start, check_out_time__lt=day_end)),
+        **{f'type_{key}': Count('id', filter=Q(visitor_type=key)) for key in VISITOR_TYPE_KEYS},
+    )
+    counts['by_type'] = {key: counts.pop(f'type_{key}') for key in VISITOR_TYPE_KEYS}
+    return counts
+
+
 @login_required
 def visitor_status_api(request, visitor_id):
-    visitor = get_object_or_404(Visitor, id=visitor_id)
+    # One JOINed SELECT of just the columns we return (no full row, no FK fetch).
+    row = Visitor.objects.filter(id=visitor_id).values(
+        'id', 'full_name', 'status', 'checked_in', 'checked_out',
+        'check_in_time', 'check_out_time', 'approved_by__username',
+    ).first()
+    if row is None:
+        raise Http404("No Visitor matches the given query.")
+
     return JsonResponse({
-        'id': visitor.id,
-        'full_name': visitor.full_name,
-        'status': visitor.status,
-        'checked_in': visitor.checked_in,
-        'checked_out': visitor.checked_out,
-        'check_in_time': visitor.check_in_time.isoformat() if visitor.check_in_time else None,
-        'check_out_time': visitor.check_out_time.isoformat() if visitor.check_out_time else None,
-        'approved_by': visitor.approved_by.username if visitor.approved_by else None
+        'id': row['id'],
+        'full_name': row['full_name'],
+        'status': row['status'],
+        'checked_in': row['checked_in'],
+        'checked_out': row['checked_out'],
+        'check_in_time': row['check_in_time'].isoformat() if row['check_in_time'] else None,
+        'check_out_time': row['check_out_time'].isoformat() if row['check_out_time'] else None,
+        'approved_by': row['approved_by__username'],
     })
 
 
@@ -1036,91 +1348,142 @@ def visitor_status_api(request, visitor_id):
 def bulk_approve_visitors(request):
     if request.method == 'POST':
         visitor_ids = request.POST.getlist('visitor_ids')
-        visitors = Visitor.objects.filter(id__in=visitor_ids, status='pending')
-
-        count = 0
-        for visitor in visitors:
-            visitor.status = 'approved'
-            visitor.approved_by = request.user
-            visitor.approval_date = timezone.now()
-            visitor.save()
 
-            VisitorLog.objects.create(
-                visitor=visitor,
-                action='approval',
-                performed_by=request.user,
-                notes='Bulk approval'
+        # Two statements for the whole batch instead of UPDATE + INSERT per row.
+        now = timezone.now()
+        with transaction.atomic():
+            # Lock the pending rows so the set we log/notify is exactly the
+            # set the UPDATE touches. Instances are still loaded because the
+            # requester notifications need the visitor details.
+            visitors = list(
+                Visitor.objects.select_for_update(of=('self',))
+                .filter(id__in=visitor_ids, status='pending')
+                .select_related('registered_by')
+            )
+            Visitor.objects.filter(pk__in=[v.pk for v in visitors]).update(
+                status='approved',
+                approved_by=request.user,
+                approval_date=now,
             )
-            count += 1
-            _notify_requester_status_change(visitor, 'approved', 'Bulk approval')
+            for visitor in visitors:
+                visitor.status = 'approved'
+                visitor.approved_by = request.user
+                visitor.approval_date = now
+
+            VisitorLog.objects.bulk_create([
+                VisitorLog(
+                    visitor=visitor,
+                    action='approval',
+                    performed_by=request.user,
+                    notes='Bulk approval'
+                )
+                for visitor in visitors
+            ], batch_size=500)
+
+        count = len(visitors)
+        # One worker task and one SMTP session for the whole batch.
+        emails = (_requester_status_email(v, 'approved', 'Bulk approval') for v in visitors)
+        _send_notification_batch([e for e in emails if e])
 
         messages.success(request, f'{count} visitors approved successfully.')
 
     return redirect('visitors:pending_approvals')
 
 
+VISITOR_EXPORT_HEADER = [
+    'Name', 'ID Number', 'Organization', 'Phone', 'Email', 'Status',
+    'Visitor Type', 'Purpose', 'Person to Visit', 'Department',
+    'Expected Date', 'Expected Time', 'Has Vehicle', 'Vehicle Plate',
+    'Registered Date', 'Registered By', 'Approved By', 'Approval Date',
+    'Checked In', 'Check In Time', 'Checked Out', 'Check Out Time',
+    'Linked Meeting',
+]
+
+VISITOR_EXPORT_COLUMNS = (
+    'full_name', 'id_number', 'organization', 'phone', 'email', 'status',
+    'visitor_type', 'purpose_of_visit', 'person_to_visit', 'department_to_visit',
+    'expected_date', 'expected_time', 'has_vehicle', 'vehicle_plate',
+    'registered_at', 'registered_by__username', 'approved_by__username', 'approval_date',
+    'checked_in', 'check_in_time', 'checked_out', 'check_out_time',
+    'linked_booking__title', 'linked_booking__date',
+)
+
+
+def _fmt_dt(value):
+    return value.strftime('%Y-%m-%d %H:%M') if value else ''
+
+
+def _visitor_export_rows(queryset):
+    """
+    Yield the CSV header then one list per visitor. Reads flat tuples via
+    values_list().iterator() so no model instances are built and memory
+    stays flat regardless of export size.
+    """
+    yield VISITOR_EXPORT_HEADER
+
+    rows = queryset.values_list(*VISITOR_EXPORT_COLUMNS).iterator(chunk_size=2000)
+    for (full_name, id_number, organization, phone, email, status,
+         visitor_type, purpose, person_to_visit, department,
+         expected_date, expected_time, has_vehicle, vehicle_plate,
+         registered_at, registered_by, approved_by, approval_date,
+         checked_in, check_in_time, checked_out, check_out_time,
+         booking_title, booking_date) in rows:
+        yield [
+            full_name,
+            id_number,
+            organization,
+            phone,
+            email,
+            Visitor.STATUS_LABELS.get(status, status),
+            Visitor.VISITOR_TYPE_LABELS.get(visitor_type, visitor_type),
+            purpose,
+            person_to_visit,
+            department,
+            expected_date,
+            expected_time,
+            'Yes' if has_vehicle else 'No',
+            vehicle_plate or '',
+            _fmt_dt(registered_at),
+            registered_by,
+            approved_by or '',
+            _fmt_dt(approval_date),
+            'Yes' if checked_in else 'No',
+            _fmt_dt(check_in_time),
+            'Yes' if checked_out else 'No',
+            _fmt_dt(check_out_time),
+            f"{booking_title} ({booking_date})" if booking_title else '',
+        ]
+
+
+class _Echo:
+    """File-like object whose write() hands the line back to the caller."""
+
+    def write(self, value):
+        return value
+
+
 @login_required
 def export_visitors(request):
-    response = HttpResponse(content_type='text/csv')
-    response['Content-Disposition'] = 'attachment; filename="visitors_export.csv"'
-
-    writer = csv.writer(response)
-    writer.writerow([
-        'Name', 'ID Number', 'Organization', 'Phone', 'Email', 'Status',
-        'Visitor Type', 'Purpose', 'Person to Visit', 'Department',
-        'Expected Date', 'Expected Time', 'Has Vehicle', 'Vehicle Plate',
-        'Registered Date', 'Registered By', 'Approved By', 'Approval Date',
-        'Checked In', 'Check In Time', 'Checked Out', 'Check Out Time',
-        'Linked Meeting',
-    ])
-
-    queryset = Visitor.objects.all().select_related(
-        'registered_by', 'approved_by', 'linked_booking'
-    )
+    queryset = Visitor.objects.all()
 
     status = request.GET.get('status')
     if status:
         queryset = queryset.filter(status=status)
 
-    date_from = request.GET.get('date_from')
+    date_from = _parse_date_param(request.GET.get('date_from'))
     if date_from:
-        queryset = queryset.filter(registered_at__date__gte=date_from)
+        queryset = queryset.filter(registered_at__gte=_day_bounds(date_from)[0])
 
-    date_to = request.GET.get('date_to')
+    date_to = _parse_date_param(request.GET.get('date_to'))
     if date_to:
-        queryset = queryset.filter(registered_at__date__lte=date_to)
-
-    for visitor in queryset.order_by('-registered_at'):
-        linked = ''
-        if visitor.linked_booking:
-            linked = f"{visitor.linked_booking.title} ({visitor.linked_booking.date})"
-
-        writer.writerow([
-            visitor.full_name,
-            visitor.id_number,
-            visitor.organization,
-            visitor.phone,
-            visitor.email,
-            visitor.get_status_display(),
-            visitor.get_visitor_type_display(),
-            visitor.purpose_of_visit,
-            visitor.person_to_visit,
-            visitor.department_to_visit,
-            visitor.expected_date,
-            visitor.expected_time,
-            'Yes' if visitor.has_vehicle else 'No',
-            visitor.vehicle_plate or '',
-            visitor.registered_at.strftime('%Y-%m-%d %H:%M'),
-            visitor.registered_by.username,
-            visitor.approved_by.username if visitor.approved_by else '',
-            visitor.approval_date.strftime('%Y-%m-%d %H:%M') if visitor.approval_date else '',
-            'Yes' if visitor.checked_in else 'No',
-            visitor.check_in_time.strftime('%Y-%m-%d %H:%M') if visitor.check_in_time else '',
-            'Yes' if visitor.checked_out else 'No',
-            visitor.check_out_time.strftime('%Y-%m-%d %H:%M') if visitor.check_out_time else '',
-            linked,
-        ])
+        queryset = queryset.filter(registered_at__lt=_day_bounds(date_to)[1])
 
+    writer = csv.writer(_Echo())
+    response = StreamingHttpResponse(
+        (writer.writerow(row) for row in _visitor_export_rows(queryset.order_by('-registered_at'))),
+        content_type='text/csv',
+    )
+    response['Content-Disposition'] = 'attachment; filename="visitors_export.csv"'
     return response
 
 
@@ -1138,16 +1501,16 @@ def visitor_verify_page(request):
     matches = []
 
     if q:
-        if q.isdigit():
-            result = Visitor.objects.filter(pk=int(q)).first()
-
-        if not result:
-            matches = list(
-                Visitor.objects.filter(
-                    Q(full_name__icontains=q) |
-                    Q(vehicle_plate__icontains=q)
-                ).order_by("-id")[:20]
-            )
+        qs, pk = _pk_priority_lookup(
+            Q(full_name__icontains=q) | Q(vehicle_plate__icontains=q),
+            q,
+            "-id",
+        )
+        rows = list(qs[:20])
+        if pk is not None and rows and rows[0].pk == pk:
+            result = rows[0]
+        else:
+            matches = rows
             if len(matches) == 1:
                 result = matches[0]
 
@@ -1177,16 +1540,22 @@ def visitor_verify_lookup_api(request):
     if not q:
         return JsonResponse({"ok": False, "error": "missing_query"}, status=400)
 
-    visitor = None
-    if q.isdigit():
-        visitor = Visitor.objects.filter(pk=int(q)).first()
-    if not visitor:
-        visitor = Visitor.objects.filter(
-            Q(full_name__iexact=q) | Q(vehicle_plate__iexact=q)
-        ).order_by("-id").first()
+    cache_key = _search_cache_key('verify', q, request.user)
+    data = cache.get(cache_key)
+    if data is not None:
+        return JsonResponse(data)
+
+    qs, _pk = _pk_priority_lookup(
+        Q(full_name__iexact=q) | Q(vehicle_plate__iexact=q),
+        q,
+        "-id",
+    )
+    visitor = qs.first()
 
     if not visitor:
-        return JsonResponse({"ok": False, "found": False})
+        data = {"ok": False, "found": False}
+        cache.set(cache_key, data, VISITOR_SEARCH_CACHE_TTL)
+        return JsonResponse(data)
 
     status = getattr(visitor, "status", None)
     is_cleared_today = visitor.clearance_is_active_today()
@@ -1207,6 +1576,7 @@ def visitor_verify_lookup_api(request):
             "valid_until": getattr(visitor, "clearance_valid_until", None),
         }
     }
+    cache.set(cache_key, data, VISITOR_SEARCH_CACHE_TTL)
     return JsonResponse(data)
 
 
@@ -1214,18 +1584,43 @@ def visitor_verify_lookup_api(request):
 # LSA clearance actions (detail page buttons)
 # -------------------------------------------------------------------
 
+# Columns the status-change views and the _notify_* emails read; anything
+# else on the row is never touched by those paths.
+VISITOR_NOTIFY_COLUMNS = (
+    'id', 'status', 'full_name', 'organization', 'purpose_of_visit',
+    'expected_date', 'expected_time', 'person_to_visit', 'department_to_visit',
+    'registered_by',
+)
+
+
+def _get_visitor_for_notify(**lookup):
+    return get_object_or_404(
+        Visitor.objects.select_related('registered_by').only(*VISITOR_NOTIFY_COLUMNS),
+        **lookup,
+    )
+
+
 @login_required
 def visitor_request_clearance(request, pk):
-    visitor = get_object_or_404(Visitor, pk=pk)
+    visitor = _get_visitor_for_notify(pk=pk)
     if request.method == "POST":
-        visitor.status = "pending"
-        visitor.save(update_fields=["status"])
-        VisitorLog.objects.create(
-            visitor=visitor,
-            action="request",
-            performed_by=request.user,
-            notes="Clearance (re)requested."
-        )
+        with transaction.atomic():
+            # Conditional UPDATE: a repeat submit while already pending is a
+            # no-op instead of another log row and another LSA/SOC email.
+            changed = Visitor.objects.filter(pk=pk).exclude(status="pending").update(status="pending")
+            if changed:
+                visitor.status = "pending"
+                VisitorLog.objects.create(
+                    visitor=visitor,
+                    action="request",
+                    performed_by=request.user,
+                    notes="Clearance (re)requested."
+                )
+
+        if not changed:
+            messages.info(request, "Clearance has already been requested.")
+            return redirect("visitors:visitor_detail", pk=pk)
+
         messages.success(request, "Clearance requested from LSA/SOC.")
         _notify_lsa_soc_new_request(visitor, request)
 
@@ -1240,18 +1635,24 @@ def visitor_lsa_approve(request, pk):
     if request.method == "POST":
         visitor.status = "approved"
         visitor.approved_by = request.user
-        visitor.approval_date = timezone.now()
+        now = timezone.now()
+        visitor.approval_date = now
 
-        _apply_clearance_window_from_post(visitor, request)
+        # The clearance window starts on the approval's local date.
+        _apply_clearance_window_from_post(visitor, request, today=timezone.localdate(now))
 
-        visitor.save()
+        with transaction.atomic():
+            visitor.save(update_fields=[
+                "status", "approved_by", "approval_date",
+                "clearance_valid_from", "clearance_valid_until",
+            ])
 
-        VisitorLog.objects.create(
-            visitor=visitor,
-            action="approval",
-            performed_by=request.user,
-            notes="Approved on visitor detail page."
-        )
+            VisitorLog.objects.create(
+                visitor=visitor,
+                action="approval",
+                performed_by=request.user,
+                notes="Approved on visitor detail page."
+            )
 
         messages.success(request, f"Visitor {visitor.full_name} approved.")
         _notify_requester_status_change(visitor, "approved")
@@ -1262,22 +1663,27 @@ def visitor_lsa_approve(request, pk):
 @login_required
 @user_passes_test(is_lsa_or_soc)
 def visitor_lsa_reject(request, pk):
-    visitor = get_object_or_404(Visitor, pk=pk)
+    visitor = _get_visitor_for_notify(pk=pk)
     if request.method == "POST":
         note = request.POST.get("notes", "").strip()
-        visitor.status = "rejected"
-        if hasattr(visitor, "rejection_reason"):
-            visitor.rejection_reason = note
-            visitor.save(update_fields=["status", "rejection_reason"])
-        else:
-            visitor.save(update_fields=["status"])
+        with transaction.atomic():
+            changed = Visitor.objects.filter(pk=pk).exclude(status="rejected").update(
+                status="rejected", rejection_reason=note,
+            )
+            if changed:
+                visitor.status = "rejected"
+                visitor.rejection_reason = note
+                VisitorLog.objects.create(
+                    visitor=visitor,
+                    action="rejection",
+                    performed_by=request.user,
+                    notes=note or "Rejected on visitor detail page."
+                )
+
+        if not changed:
+            messages.info(request, f"Visitor {visitor.full_name} is already rejected.")
+            return redirect("visitors:visitor_detail", pk=pk)
 
-        VisitorLog.objects.create(
-            visitor=visitor,
-            action="rejection",
-            performed_by=request.user,
-            notes=note or "Rejected on visitor detail page."
-        )
         messages.warning(request, f"Visitor {visitor.full_name} rejected.")
         _notify_requester_status_change(visitor, 'rejected', note)
 
@@ -1286,29 +1692,33 @@ def visitor_lsa_reject(request, pk):
 
 @login_required
 def visitor_cancel_request(request, pk):
-    visitor = get_object_or_404(Visitor, pk=pk)
-    can_cancel = (
-        request.user.is_superuser
-        or getattr(request.user, "role", None) == "lsa"
-        or (visitor.registered_by_id and visitor.registered_by_id == request.user.id)
-    )
-    if not can_cancel:
-        messages.error(request, "You cannot cancel this request.")
-        return redirect("visitors:visitor_detail", pk=pk)
+    # Non-LSA users may only cancel their own requests; anything else is a
+    # 404 from the same query rather than a fetch followed by a refusal.
+    lookup = {'pk': pk}
+    if not (request.user.is_superuser or getattr(request.user, "role", None) == "lsa"):
+        lookup['registered_by_id'] = request.user.id
+    visitor = _get_visitor_for_notify(**lookup)
 
     if request.method == "POST":
-        visitor.status = "cancelled"
-        visitor.save(update_fields=["status"])
-        VisitorLog.objects.create(
-            visitor=visitor,
-            action="cancel",
-            performed_by=request.user,
-            notes="Request cancelled."
-        )
+        with transaction.atomic():
+            changed = Visitor.objects.filter(pk=pk).exclude(status="cancelled").update(status="cancelled")
+            if changed:
+                visitor.status = "cancelled"
+                VisitorLog.objects.create(
+                    visitor=visitor,
+                    action="cancel",
+                    performed_by=request.user,
+                    notes="Request cancelled."
+                )
+
+        if not changed:
+            messages.info(request, "This request is already cancelled.")
+            return redirect("visitors:visitor_detail", pk=pk)
+
         messages.info(request, "Visitor request cancelled.")
-        _notify_lsa_soc_new_request(visitor, request)
+        _notify_lsa_soc_cancelled(visitor, request)
 
-        if request.user != visitor.registered_by:
+        if visitor.registered_by_id != request.user.id:
             _notify_requester_status_change(visitor, 'cancelled')
 
     return redirect("visitors:visitor_detail", pk=pk)
@@ -1409,19 +1819,7 @@ def gate_check_view(request, pk):
                 with transaction.atomic():
                     now = timezone.now()
 
-                    main_card = VisitorCard.objects.select_for_update().get(number__iexact=card_number)
-                    if not main_card.is_active:
-                        raise ValueError(f"Card {main_card.number} is inactive.")
-                    if main_card.in_use:
-                        raise ValueError(f"Card {main_card.number} is already in use.")
-
-                    main_card.in_use = True
-                    main_card.issued_to = visitor
-                    main_card.issued_at = now
-                    main_card.issued_by = request.user
-                    main_card.returned_at = None
-                    main_card.returned_by = None
-                    main_card.save()
+                    main_card = VisitorCard.issue(card_number, visitor, request.user, now)
 
                     visitor.visitor_card = main_card
                     visitor.card_issued_at = now
@@ -1445,32 +1843,20 @@ def gate_check_view(request, pk):
                         if mcard_num.lower() == card_number.lower():
                             raise ValueError(f"Group member card {mcard_num} is the same as the primary visitor card.")
 
-                        gc = VisitorCard.objects.select_for_update().get(number__iexact=mcard_num)
-                        if not gc.is_active:
-                            raise ValueError(f"Group card {gc.number} is inactive.")
-                        if gc.in_use:
-                            raise ValueError(f"Group card {gc.number} is already in use.")
-
-                        gc.in_use = True
-                        gc.issued_to = visitor
-                        gc.issued_at = now
-                        gc.issued_by = request.user
-                        gc.returned_at = None
-                        gc.returned_by = None
-                        gc.save()
+                        gc = VisitorCard.issue(mcard_num, visitor, request.user, now, label="Group card")
                         group_card_numbers.append(gc.number)
 
-                base_note = f"Issued card {main_card.number}"
-                if group_card_notes:
-                    base_note += " | Group: " + "; ".join(group_card_notes)
+                    base_note = f"Issued card {main_card.number}"
+                    if group_card_notes:
+                        base_note += " | Group: " + "; ".join(group_card_notes)
 
-                VisitorLog.objects.create(
-                    visitor=visitor,
-                    action="check_in",
-                    performed_by=request.user,
-                    gate=gate,
-                    notes=base_note,
-                )
+                    VisitorLog.objects.create(
+                        visitor=visitor,
+                        action="check_in",
+                        performed_by=request.user,
+                        gate=gate,
+                        notes=base_note,
+                    )
 
                 messages.success(
                     request,
@@ -1498,14 +1884,11 @@ def gate_check_view(request, pk):
                 return redirect("visitors:visitor_detail", pk=visitor.pk)
 
             with transaction.atomic():
-                cards_qs = VisitorCard.objects.select_for_update().filter(
-                    issued_to=visitor,
-                    in_use=True,
-                )
-
                 now = timezone.now()
 
-                if not cards_qs.exists():
+                card_numbers = VisitorCard.collect_from(visitor, request.user, now)
+
+                if not card_numbers:
                     visitor.checked_in = False
                     visitor.checked_out = True
                     visitor.check_out_time = now
@@ -1526,15 +1909,6 @@ def gate_check_view(request, pk):
                     messages.warning(request, "Visitor checked out, but no cards were currently marked as in use.")
                     return redirect("visitors:visitor_detail", pk=visitor.pk)
 
-                card_numbers = []
-                for card in cards_qs:
-                    card.in_use = False
-                    card.returned_at = now
-                    card.returned_by = request.user
-                    card.issued_to = None
-                    card.save()
-                    card_numbers.append(card.number)
-
                 visitor.card_returned_at = now
                 visitor.visitor_card = None
                 visitor.checked_in = False
@@ -1545,13 +1919,13 @@ def gate_check_view(request, pk):
                     "checked_in", "checked_out", "check_out_time"
                 ])
 
-            VisitorLog.objects.create(
-                visitor=visitor,
-                action="check_out",
-                performed_by=request.user,
-                gate=gate,
-                notes=f"Collected cards {', '.join(card_numbers)}",
-            )
+                VisitorLog.objects.create(
+                    visitor=visitor,
+                    action="check_out",
+                    performed_by=request.user,
+                    gate=gate,
+                    notes=f"Collected cards {', '.join(card_numbers)}",
+                )
 
             messages.success(request, f"Checked out. Collected cards: {', '.join(card_numbers)}")
 
@@ -1580,26 +1954,25 @@ def visitor_card_list(request):
         qs = qs.filter(Q(number__icontains=q))
 
     flt = (request.GET.get('filter') or 'all').strip()
-    if flt == 'available':
-        qs = qs.filter(is_active=True, in_use=False)
-    elif flt == 'in_use':
-        qs = qs.filter(is_active=True, in_use=True)
-    elif flt == 'inactive':
-        qs = qs.filter(is_active=False)
+    if flt in CARD_LIST_FILTERS:
+        qs = qs.filter(CARD_LIST_FILTERS[flt])
+
+    # All four header counters in one pass over the card table.
+    card_counts = VisitorCard.objects.aggregate(
+        total=Count('id'),
+        **{name: Count('id', filter=cond) for name, cond in CARD_LIST_FILTERS.items()},
+    )
 
     paginator = Paginator(qs, 25)
+    counted_as = 'total' if flt == 'all' else (flt if flt in CARD_LIST_FILTERS else None)
+    if not q and counted_as:
+        # The unsearched list is exactly one of the counted sets; seed the
+        # paginator's cached count instead of running another COUNT(*).
+        paginator.__dict__['count'] = card_counts[counted_as]
     page_number = request.GET.get('page')
     page_obj = paginator.get_page(page_number)
 
-    total_cards = VisitorCard.objects.count()
-    available_cards = VisitorCard.objects.filter(is_active=True, in_use=False).count()
-    in_use_cards = VisitorCard.objects.filter(is_active=True, in_use=True).count()
-    inactive_cards = VisitorCard.objects.filter(is_active=False).count()
-
-    can_manage_cards = (
-        request.user.is_superuser
-        or getattr(request.user, 'role', None) in {'lsa', 'soc', 'data_entry'}
-    )
+    can_manage_cards = _is_privileged(request.user)
 
     context = {
         'cards': page_obj,
@@ -1608,10 +1981,10 @@ def visitor_card_list(request):
         'is_paginated': page_obj.has_other_pages(),
         'q': q,
         'filter': flt,
-        'total_cards': total_cards,
-        'available_cards': available_cards,
-        'in_use_cards': in_use_cards,
-        'inactive_cards': inactive_cards,
+        'total_cards': card_counts['total'],
+        'available_cards': card_counts['available'],
+        'in_use_cards': card_counts['in_use'],
+        'inactive_cards': card_counts['inactive'],
         'current_time': timezone.now(),
         'can_manage_cards': can_manage_cards,
     }
@@ -1620,11 +1993,7 @@ def visitor_card_list(request):
 
 @login_required
 def visitor_card_create(request):
-    user = request.user
-    allowed_roles = {'lsa', 'soc', 'data_entry'}
-    user_role = getattr(user, 'role', None)
-
-    if not (user.is_superuser or user_role in allowed_roles):
+    if not _is_privileged(request.user):
         messages.error(request, "You do not have permission to create visitor cards.")
         return redirect('visitors:visitor_card_list')
 
@@ -1663,13 +2032,15 @@ def visitor_card_create(request):
 
 @login_required
 def visitor_card_detail(request, pk):
-    card = get_object_or_404(VisitorCard, pk=pk)
+    # issued_to is rendered twice by the template; join it up front.
+    card = get_object_or_404(VisitorCard.objects.select_related('issued_to'), pk=pk)
 
+    # Lazy: only evaluated (once) when the GET path renders it.
     card_history = (
         VisitorLog.objects
         .filter(Q(card=card) | Q(notes__icontains=card.number))
         .select_related('visitor', 'performed_by')
-        .order_by('-timestamp')
+        .order_by('-timestamp')[:CARD_HISTORY_LIMIT]
     )
 
     can_manage = request.user.has_perm('visitors.change_visitorcard')
@@ -1679,11 +2050,11 @@ def visitor_card_detail(request, pk):
 
         if action == "deactivate" and card.is_active:
             card.is_active = False
-            card.save()
+            card.save(update_fields=["is_active"])
             messages.success(request, f"Card {card.number} has been deactivated.")
         elif action == "activate" and not card.is_active:
             card.is_active = True
-            card.save()
+            card.save(update_fields=["is_active"])
             messages.success(request, f"Card {card.number} has been activated.")
         else:
             messages.warning(request, "No changes were applied to this card.")
@@ -1703,17 +2074,27 @@ def visitor_card_check_api(request):
     number = (request.GET.get('number') or '').strip()
     if not number:
         return JsonResponse({'ok': False, 'error': 'missing_number'}, status=400)
-    try:
-        card = VisitorCard.objects.get(number__iexact=number)
-        return JsonResponse({
-            'ok': True,
-            'exists': True,
-            'is_active': card.is_active,
-            'in_use': card.in_use,
-            'available': card.is_active and not card.in_use,
-        })
-    except VisitorCard.DoesNotExist:
-        return JsonResponse({'ok': True, 'exists': False, 'available': False})
+    # The gate form validates as the guard types; absorb the repeats.
+    data = cache.get_or_set(
+        _search_cache_key('card', number),
+        lambda: _card_check_payload(number),
+        CARD_CHECK_CACHE_TTL,
+    )
+    return JsonResponse(data)
+
+
+def _card_check_payload(number):
+    row = VisitorCard.objects.filter(number__iexact=number).values_list('is_active', 'in_use').first()
+    if row is None:
+        return {'ok': True, 'exists': False, 'available': False}
+    is_active, in_use = row
+    return {
+        'ok': True,
+        'exists': True,
+        'is_active': is_active,
+        'in_use': in_use,
+        'available': is_active and not in_use,
+    }
 
 
 # -------------------------------------------------------------------
@@ -1726,34 +2107,54 @@ class VisitorReportView(LoginRequiredMixin, TemplateView):
     def get_queryset_base(self):
         user = self.request.user
         qs = Visitor.objects.all()
-        privileged_roles = {'lsa', 'soc', 'data_entry'}
-        if not (user.is_superuser or getattr(user, 'role', None) in privileged_roles):
+        if not _is_privileged(user):
             qs = qs.filter(registered_by=user)
         return qs
 
     def get_context_data(self, **kwargs):
         ctx = super().get_context_data(**kwargs)
-        qs = self.get_queryset_base()
-        today = timezone.now().date()
-
-        ctx["total_visitors"] = qs.count()
-        ctx["pending_count"] = qs.filter(status="pending").count()
-        ctx["approved_count"] = qs.filter(status="approved").count()
-        ctx["rejected_count"] = qs.filter(status="rejected").count()
-        ctx["cancelled_count"] = qs.filter(status="cancelled").count()
+        user = self.request.user
+        today = timezone.localdate()
 
-        ctx["today_visitors"] = qs.filter(
-            Q(registered_at__date=today)
-        ).count()
+        # Privileged users all see the same figures and share one entry;
+        # everyone else only sees their own registrations.
+        scope = "all" if _is_privileged(user) else user.pk
+        ctx.update(cache.get_or_set(
+            f"visitors:report:{scope}:{today.isoformat()}",
+            lambda: self._report_counts(today),
+            VISITOR_REPORT_CACHE_TTL,
+        ))
+        return ctx
 
-        last_7_days = []
-        for i in range(7):
-            day = today - timedelta(days=i)
-            c = qs.filter(registered_at__date=day).count()
-            last_7_days.append({"date": day, "count": c})
-        ctx["last_7_days"] = list(reversed(last_7_days))
+    def _report_counts(self, today):
+        qs = self.get_queryset_base()
+        days = [today - timedelta(days=i) for i in range(6, -1, -1)]
+
+        # Status totals and the 7-day trend buckets in a single query.
+        day_counts = {}
+        for i, day in enumerate(days):
+            start, end = _day_bounds(day)
+            day_counts[f"day_{i}"] = Count("id", filter=Q(registered_at__gte=start, registered_at__lt=end))
+        counts = qs.aggregate(
+            total=Count("id"),
+            pending=Count("id", filter=Q(status="pending")),
+            approved=Count("id", filter=Q(status="approved")),
+            rejected=Count("id", filter=Q(status="rejected")),
+            cancelled=Count("id", filter=Q(status="cancelled")),
+            **day_counts,
+        )
 
-        return ctx
+        return {
+            "total_visitors": counts["total"],
+            "pending_count": counts["pending"],
+            "approved_count": counts["approved"],
+            "rejected_count": counts["rejected"],
+            "cancelled_count": counts["cancelled"],
+            "today_visitors": counts[f"day_{len(days) - 1}"],
+            "last_7_days": [
+                {"date": day, "count": counts[f"day_{i}"]} for i, day in enumerate(days)
+            ],
+        }
 
 
 # -------------------------------------------------------------------
@@ -28,16 +28,12 @@ from django.utils import timezone
 from django.db import transaction
 
 from .models import Visitor, GroupMember, VisitorCard, VisitorLog
+from .roles import _gate_role
+from .tasks import send_mail_task
 
 logger = logging.getLogger(__name__)
 
 
-def _gate_role(user):
-    return user.is_authenticated and (
-        getattr(user, 'role', None) in ('data_entry', 'lsa', 'soc') or user.is_superuser
-    )
-
-
 # ─────────────────────────────────────────────────────────────────────────────
 # Individual member check-in
 # ─────────────────────────────────────────────────────────────────────────────
@@ -97,19 +93,9 @@ def member_checkin(request, visitor_id, member_id):
         with transaction.atomic():
             now = timezone.now()
 
-            card = VisitorCard.objects.select_for_update().get(number__iexact=card_number)
-            if not card.is_active:
-                raise ValueError(f"Card {card.number} is inactive.")
-            if card.in_use:
-                raise ValueError(f"Card {card.number} is already in use.")
-
-            card.in_use = True
-            card.issued_to = visitor
-            card.issued_at = now
-            card.issued_by = request.user
-            card.returned_at = None
-            card.returned_by = None
-            card.save()
+            # Compare-and-set claim: no row lock, and a concurrent guard
+            # issuing the same card gets "already in use" instead of waiting.
+            card = VisitorCard.issue(card_number, visitor, request.user, now)
 
             fields_updated = {}
             if id_number and id_number != member.id_number:
@@ -122,7 +108,10 @@ def member_checkin(request, visitor_id, member_id):
             member.checked_out = False
             member.check_in_time = now
             member.check_out_time = None
-            member.save()
+            member.save(update_fields=[
+                'id_number', 'id_type', 'assigned_card',
+                'checked_in', 'checked_out', 'check_in_time', 'check_out_time',
+            ])
 
             photo_file = request.FILES.get('gate_photo') or request.FILES.get('photo')
             photo_url = None
@@ -200,7 +189,9 @@ def member_checkout(request, visitor_id, member_id):
         return redirect('visitors:visitor_detail', pk=visitor_id)
 
     visitor = get_object_or_404(Visitor, pk=visitor_id)
-    member  = get_object_or_404(GroupMember, pk=member_id, visitor=visitor)
+    member  = get_object_or_404(
+        GroupMember.objects.select_related('assigned_card'), pk=member_id, visitor=visitor,
+    )
     gate    = (request.POST.get('gate') or 'front').strip()
 
     if not member.checked_in or member.checked_out:
@@ -211,32 +202,45 @@ def member_checkout(request, visitor_id, member_id):
 
     with transaction.atomic():
         now = timezone.now()
-        card_number_returned = None
-
-        if member.assigned_card:
-            card = VisitorCard.objects.select_for_update().get(pk=member.assigned_card.pk)
-            card.in_use = False
-            card.returned_at = now
-            card.returned_by = request.user
-            card.issued_to = None
-            card.save()
-            card_number_returned = card.number
+        card = member.assigned_card
+        card_number_returned = card.number if card else None
+
+        # Conditional UPDATEs instead of locking and re-saving: a concurrent
+        # double submit matches no row and is reported, not logged twice.
+        claimed = GroupMember.objects.filter(
+            pk=member.pk, checked_in=True, checked_out=False,
+        ).update(assigned_card=None, checked_in=False, checked_out=True, check_out_time=now)
+
+        if claimed:
+            if card:
+                returned = VisitorCard.objects.filter(pk=card.pk, in_use=True).update(
+                    in_use=False, returned_at=now, returned_by=request.user, issued_to=None,
+                )
+                if not returned:
+                    logger.warning(
+                        "Card %s was already returned when %s checked out", card.number, member.full_name,
+                    )
+
             member.assigned_card = None
+            member.checked_in = False
+            member.checked_out = True
+            member.check_out_time = now
 
-        member.checked_in = False
-        member.checked_out = True
-        member.check_out_time = now
-        member.save()
+            VisitorLog.objects.create(
+                visitor=visitor,
+                action='member_check_out',
+                performed_by=request.user,
+                gate=gate,
+                group_member=member,
+                notes=f"{member.full_name} checked out"
+                      + (f" · Card {card_number_returned} returned" if card_number_returned else " (no card)"),
+            )
 
-        VisitorLog.objects.create(
-            visitor=visitor,
-            action='member_check_out',
-            performed_by=request.user,
-            gate=gate,
-            group_member=member,
-            notes=f"{member.full_name} checked out"
-                  + (f" · Card {card_number_returned} returned" if card_number_returned else " (no card)"),
-        )
+    if not claimed:
+        if is_fetch:
+            return _json_error(f"{member.full_name} is not currently checked in.")
+        messages.warning(request, f"{member.full_name} is not currently checked in.")
+        return redirect('visitors:visitor_detail', pk=visitor_id)
 
     msg = (
         f"{member.full_name} checked out."
@@ -296,17 +300,18 @@ def member_flag_attention(request, visitor_id, member_id):
     member.gate_attention = 'needs_attention'
     member.gate_attention_note = note
     member.gate_attention_raised_at = now
-    member.save(update_fields=['gate_attention', 'gate_attention_note', 'gate_attention_raised_at'])
+    with transaction.atomic():
+        member.save(update_fields=['gate_attention', 'gate_attention_note', 'gate_attention_raised_at'])
 
-    gate_user = request.user.get_full_name() or request.user.username
+        VisitorLog.objects.create(
+            visitor=visitor,
+            action='gate_flag',
+            performed_by=request.user,
+            group_member=member,
+            notes=f"Attention flagged for {member.full_name}: {note}",
+        )
 
-    VisitorLog.objects.create(
-        visitor=visitor,
-        action='gate_flag',
-        performed_by=request.user,
-        group_member=member,
-        notes=f"Attention flagged for {member.full_name}: {note}",
-    )
+    gate_user = request.user.get_full_name() or request.user.username
 
     # ── Propagate flag to MeetingAttendee (meeting-linked visitors) ──────────
     if member.from_meeting:
@@ -378,7 +383,7 @@ def _resolve_host_and_url(visitor, request):
 
 def _send_attention_email(visitor, member, note, gate_user, host, detail_url):
     """
-    Send an attention-alert email to the host in a background thread.
+    Queue an attention-alert email to the host on the Celery worker.
     Works for both meeting-linked and standalone visitor access requests.
     """
     if not host or not getattr(host, 'email', None):
@@ -413,15 +418,15 @@ def _send_attention_email(visitor, member, note, gate_user, host, detail_url):
             f"Please come to the gate or contact security to help verify and clear this person.\n\n"
             f"{'View meeting details' if is_meeting else 'View visitor record'}: {detail_url}\n\n"
             f"Flagged by: {gate_user}\n"
-            f"Time: {timezone.now().strftime('%Y-%m-%d %H:%M')}\n\n"
+            f"Time: {(member.gate_attention_raised_at or timezone.now()).strftime('%Y-%m-%d %H:%M')}\n\n"
             f"Best regards,\nUN Security / Gate Management System"
         )
 
-        import threading
-        threading.Thread(
-            target=lambda: send_mail(subject, body, from_email, [host.email], fail_silently=True),
-            daemon=True,
-        ).start()
+        try:
+            send_mail_task.delay(subject, body, from_email, [host.email])
+        except Exception as exc:
+            logger.warning("Could not queue attention email, sending inline: %s", exc)
+            send_mail(subject, body, from_email, [host.email], fail_silently=True)
 
     except Exception as e:
         logger.warning("Failed to send attention email: %s", e)
@@ -447,15 +452,16 @@ def member_clear_attention(request, visitor_pk, member_pk):
 
     member.gate_attention = 'cleared'
     member.gate_attention_cleared_at = timezone.now()
-    member.save(update_fields=['gate_attention', 'gate_attention_cleared_at'])
-
-    VisitorLog.objects.create(
-        visitor=visitor,
-        action='gate_cleared',
-        performed_by=request.user,
-        group_member=member,
-        notes=f"Attention cleared for {member.full_name} by {request.user.username}",
-    )
+    with transaction.atomic():
+        member.save(update_fields=['gate_attention', 'gate_attention_cleared_at'])
+
+        VisitorLog.objects.create(
+            visitor=visitor,
+            action='gate_cleared',
+            performed_by=request.user,
+            group_member=member,
+            notes=f"Attention cleared for {member.full_name} by {request.user.username}",
+        )
 
     messages.success(request, f"Attention flag cleared for {member.full_name}.")
     return redirect('visitors:visitor_detail', pk=visitor_pk)